@@ -9,7 +9,6 @@ import os
 import sys
 import json
 import csv
-import time
 from datetime import datetime, timezone
 from collections import defaultdict
 
@@ -101,20 +100,25 @@ def enhance_transactions_with_btc(transactions, client, address):
     
     print(f"\nFetching BTC amounts for {total} transactions...")
     
-    for i, tx in enumerate(transactions, 1):
-        txid = tx.get('txid', '')
-        tx_type = tx.get('type', 'UNKNOWN')
-        
-        print(f"  [{i}/{total}] Fetching details for {txid[:16]}...", end=" ", flush=True)
+    # Fetch all transaction details concurrently, reporting each as it arrives
+    txids = list(dict.fromkeys(tx.get('txid', '') for tx in transactions))
+    details_by_txid = {}
+    for i, (txid, tx_details) in enumerate(client.iter_transactions_details(txids), 1):
+        print(f"  [{i}/{len(txids)}] Fetched details for {txid[:16]}...", end=" ", flush=True)
         
-        # Fetch transaction details
-        tx_details = None
-        try:
-            tx_details = client.fetch_transaction_details(txid)
+        if isinstance(tx_details, Exception):
+            # Continue with default values
+            tx_details = None
+        if tx_details:
             print("✓")
-        except Exception as e:
+        else:
             print(f"✗ (using defaults)")
-            # Continue with default values
+        details_by_txid[txid] = tx_details
+    
+    for tx in transactions:
+        txid = tx.get('txid', '')
+        tx_type = tx.get('type', 'UNKNOWN')
+        tx_details = details_by_txid.get(txid)
         
         # Extract BTC amounts
         btc_amount, fee_btc = extract_btc_amount_from_tx_details(tx_details, address, tx_type)
@@ -126,10 +130,6 @@ def enhance_transactions_with_btc(transactions, client, address):
         enhanced_tx['tx_details'] = tx_details
         
         enhanced.append(enhanced_tx)
-        
-        # Rate limiting - small delay between requests
-        if i < total:
-            time.sleep(0.1)
     
     return enhanced
 
@@ -9,7 +9,6 @@ import os
 import sys
 import json
 import csv
-import time
 from datetime import datetime, timezone
 from collections import defaultdict
 
@@ -125,23 +124,26 @@ def enhance_transactions_with_btc(transactions, client, address):
     print(f"\nFetching BTC amounts for {total} transactions...")
     print("This may take a while due to API rate limits...\n")
     
-    for i, tx in enumerate(transactions, 1):
-        txid = tx.get('txid', '')
-        tx_type = tx.get('type', 'UNKNOWN')
-        
-        print(f"  [{i}/{total}] {txid[:16]}... ({tx_type})", end=" ", flush=True)
+    # Fetch all transaction details concurrently, reporting each as it arrives
+    txids = list(dict.fromkeys(tx.get('txid', '') for tx in transactions))
+    details_by_txid = {}
+    for i, (txid, tx_details) in enumerate(client.iter_transactions_details(txids), 1):
+        print(f"  [{i}/{len(txids)}] {txid[:16]}...", end=" ", flush=True)
         
-        # Fetch transaction details
-        tx_details = None
-        try:
-            tx_details = client.fetch_transaction_details(txid)
-            if tx_details:
-                print("✓")
-            else:
-                print("✗ (no details)")
-        except Exception as e:
-            print(f"✗ ({str(e)[:30]})")
+        if isinstance(tx_details, Exception):
+            print(f"✗ ({str(tx_details)[:30]})")
             # Continue with default values
+            tx_details = None
+        elif tx_details:
+            print("✓")
+        else:
+            print("✗ (no details)")
+        details_by_txid[txid] = tx_details
+    
+    for tx in transactions:
+        txid = tx.get('txid', '')
+        tx_type = tx.get('type', 'UNKNOWN')
+        tx_details = details_by_txid.get(txid)
         
         # Extract BTC amounts
         received_btc, sent_btc, fee_btc = extract_btc_from_transaction(tx_details, address, tx_type)
@@ -163,10 +165,6 @@ def enhance_transactions_with_btc(transactions, client, address):
         enhanced_tx['tx_details'] = tx_details
         
         enhanced.append(enhanced_tx)
-        
-        # Rate limiting - small delay between requests
-        if i < total:
-            time.sleep(0.2)  # 200ms delay to avoid rate limits
     
     return enhanced
 
@@ -389,8 +389,9 @@ def generate_html_ledger(ledger_csv_path, raw_json_path, output_dir, address):
                 <tbody id="ledgerBody">
 """
     
-    # Add table rows
-    for entry in ledger_entries:
+    # Add table rows (collected into a pre-sized list and joined once)
+    rows = [None] * len(ledger_entries)
+    for i, entry in enumerate(ledger_entries):
         row_class = entry['Type'].lower()
         type_badge_class = entry['Type'].lower()
         debit_class = 'debit' if int(entry['Debit']) > 0 else ''
@@ -409,7 +410,7 @@ def generate_html_ledger(ledger_csv_path, raw_json_path, output_dir, address):
         debit_btc_class = 'debit' if debit_btc > 0 else ''
         credit_btc_class = 'credit' if credit_btc > 0 else ''
         
-        html_content += f"""
+        rows[i] = f"""
                     <tr class="{row_class}" data-type="{entry['Type']}" data-date="{entry['Date']}" data-txid="{entry['Transaction ID']}" data-inscription="{entry['Inscription ID']}">
                         <td>{entry['Date']}</td>
                         <td>{entry['Time']}</td>
@@ -426,6 +427,7 @@ def generate_html_ledger(ledger_csv_path, raw_json_path, output_dir, address):
                         <td><span class="confirmed-badge {confirmed_class}">{entry['Confirmed']}</span></td>
                     </tr>
 """
+    html_content += ''.join(rows)
     
     html_content += """
                 </tbody>
@@ -426,8 +426,9 @@ def generate_tax_ledger_html(tax_ledger_csv_path, raw_json_path, output_dir, add
                 <tbody id="ledgerBody">
 """
     
-    # Add table rows
-    for entry in ledger_entries:
+    # Add table rows (collected into a pre-sized list and joined once)
+    rows = [None] * len(ledger_entries)
+    for i, entry in enumerate(ledger_entries):
         row_class = entry['Type'].lower()
         type_badge_class = entry['Type'].lower()
         debit_btc = float(entry.get('Debit BTC', 0.0))
@@ -444,7 +445,7 @@ def generate_tax_ledger_html(tax_ledger_csv_path, raw_json_path, output_dir, add
         txid_short = entry['Transaction ID'][:16] + '...' if len(entry['Transaction ID']) > 16 else entry['Transaction ID']
         inscription_short = entry['Inscription ID'][:20] + '...' if len(entry['Inscription ID']) > 20 else entry['Inscription ID']
         
-        html_content += f"""
+        rows[i] = f"""
                     <tr class="{row_class}" data-type="{entry['Type']}" data-date="{entry['Date']}" data-txid="{entry['Transaction ID']}" data-inscription="{entry['Inscription ID']}">
                         <td>{entry['Date']}</td>
                         <td>{entry['Time']}</td>
@@ -460,6 +461,7 @@ def generate_tax_ledger_html(tax_ledger_csv_path, raw_json_path, output_dir, add
                         <td><span class="confirmed-badge {confirmed_class}">{entry['Confirmed']}</span></td>
                     </tr>
 """
+    html_content += ''.join(rows)
     
     html_content += """
                 </tbody>
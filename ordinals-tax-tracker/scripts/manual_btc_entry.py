@@ -12,6 +12,11 @@ import json
 import csv
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Ensure we can import from the same directory
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 if _script_dir not in sys.path:
@@ -102,25 +107,20 @@ def apply_btc_mapping(raw_json_path, mapping_csv_path, output_dir, address):
                 except ValueError:
                     print(f"Warning: Invalid BTC amount for {txid}: {btc_amount}")
     
-    # Apply mapping to transactions
-    enhanced_transactions = []
+    # Apply mapping to transactions in place (the raw list is not reused)
     for tx in transactions:
-        txid = tx.get('txid', '')
-        enhanced_tx = tx.copy()
-        
-        if txid in btc_map:
-            enhanced_tx['btc_amount'] = btc_map[txid]['btc_amount']
-            enhanced_tx['fee_btc'] = btc_map[txid]['fee_btc']
-        else:
-            enhanced_tx['btc_amount'] = 0.0
-            enhanced_tx['fee_btc'] = 0.0
-        
-        enhanced_transactions.append(enhanced_tx)
+        mapped = btc_map.get(tx.get('txid', ''))
+        tx['btc_amount'] = mapped['btc_amount'] if mapped else 0.0
+        tx['fee_btc'] = mapped['fee_btc'] if mapped else 0.0
     
     # Save enhanced transactions
     enhanced_json_path = os.path.join(output_dir, f"{address}_enhanced.json")
-    with open(enhanced_json_path, 'w', encoding='utf-8') as f:
-        json.dump(enhanced_transactions, f, indent=2)
+    if orjson is not None:
+        with open(enhanced_json_path, 'wb') as f:
+            f.write(orjson.dumps(transactions, option=orjson.OPT_INDENT_2))
+    else:
+        with open(enhanced_json_path, 'w', encoding='utf-8') as f:
+            json.dump(transactions, f, indent=2)
     
     print(f"Applied BTC mapping. Enhanced data saved to: {enhanced_json_path}")
     print(f"\nFound BTC amounts for {len(btc_map)} transactions")
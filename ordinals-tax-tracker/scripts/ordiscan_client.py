@@ -7,13 +7,23 @@ All endpoint paths are configurable via constants at the top of this file.
 To find the correct endpoint paths, check: https://ordiscan.com/docs/api
 """
 
+import os
 import time
-import urllib.request
-import urllib.error
+import random
+import hashlib
+import queue
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import urllib.parse
 import json
 import ssl
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 # ============================================================================
 # CONFIGURATION: Adjust these based on Ordiscan API documentation
 # ============================================================================
@@ -34,22 +44,116 @@ TRANSACTION_DETAILS_ENDPOINT = "/v1/tx/{txid}"
 # TRANSACTION_DETAILS_ENDPOINT = "/v1/transaction/{txid}"
 # ============================================================================
 
+# Socket timeout (seconds) for the persistent API connection
+REQUEST_TIMEOUT = 30
+
+# Maximum number of transaction-detail requests in flight at once
+MAX_CONCURRENT_REQUESTS = 16
+
+# Maximum number of idle keep-alive connections kept for reuse
+CONNECTION_POOL_SIZE = 20
+
+# Number of activity pages requested concurrently once an address is known
+# to have more than one page
+PAGE_FETCH_WINDOW = 8
+
+# Cached API data lives in the project's cache/ directory (next to scripts/),
+# whatever directory the scripts are run from
+_CACHE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+
+# Directory for cached transaction details. Confirmed transactions never
+# change, so their details are stored as <dir>/<txid[:2]>/<txid>.json and
+# reused on later runs. Set to None to disable the cache.
+TRANSACTION_CACHE_DIR = os.path.join(_CACHE_ROOT, "transactions")
+
+# Directory for cached activity pages, keyed by a hash of the request URL,
+# and how long (seconds) a cached page stays valid. Set the directory to
+# None to disable the cache.
+RESPONSE_CACHE_DIR = os.path.join(_CACHE_ROOT, "responses")
+RESPONSE_CACHE_TTL = 7 * 24 * 3600
+
+
+def is_confirmed(tx_details):
+    """
+    Check whether transaction details describe a confirmed transaction.
+    
+    Looks for the confirmation fields commonly returned by Bitcoin APIs;
+    anything without positive evidence of confirmation is treated as unconfirmed.
+    """
+    if not isinstance(tx_details, dict):
+        return False
+    
+    status = tx_details.get('status')
+    if isinstance(status, dict) and status.get('confirmed'):
+        return True
+    if tx_details.get('confirmed') is True:
+        return True
+    
+    for field in ['confirmations', 'block_height', 'blockheight']:
+        value = tx_details.get(field)
+        if isinstance(value, int) and value > 0:
+            return True
+    return False
+
+
+def _read_json_file(path):
+    """Load a JSON cache file, returning None if it is missing or unreadable."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_file(path, data):
+    """
+    Atomically write a JSON cache file, creating its directory if needed.
+    
+    Caching is best effort: if the file can't be written (full disk,
+    read-only directory, permissions) the error is ignored and no temp file
+    is left behind.
+    """
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
 
 class OrdiscanClient:
     """Client for interacting with the Ordiscan API."""
     
-    def __init__(self, api_key):
+    def __init__(self, api_key, cache_dir=TRANSACTION_CACHE_DIR,
+                 response_cache_dir=RESPONSE_CACHE_DIR, refresh=False):
         """
         Initialize the Ordiscan client.
         
         Args:
             api_key: Your Ordiscan API key
+            cache_dir: Directory for cached transaction details (None disables caching)
+            response_cache_dir: Directory for cached activity pages (None disables caching)
+            refresh: Ignore existing cache entries (fresh responses are still cached)
         """
         self.api_key = api_key
         self.base_url = ORDISCAN_BASE_URL
+        self.cache_dir = cache_dir
+        self.response_cache_dir = response_cache_dir
+        self.refresh = refresh
         # Create SSL context with system certificates (maintains SSL verification)
         # On macOS, Python may not find certificates automatically, so we load them explicitly
-        import os
         self.ssl_context = ssl.create_default_context()
         
         # Try loading system certificate locations common on macOS/Linux
@@ -64,6 +168,82 @@ class OrdiscanClient:
                     break
                 except Exception:
                     pass  # Try next path
+        
+        # Keep-alive connections are pooled and reused across requests (and
+        # threads) so paginated and per-transaction calls don't each pay a
+        # TCP+TLS handshake. A connection is only used by one request at a time.
+        self._host = urllib.parse.urlsplit(self.base_url).netloc
+        self._pool = queue.LifoQueue(maxsize=CONNECTION_POOL_SIZE)
+        # Caps requests in flight across all threads to stay under the API's limit
+        self._request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        }
+    
+    def close(self):
+        """Close all pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+    
+    def _new_connection(self):
+        """Open a new HTTPS connection to the API host."""
+        return http.client.HTTPSConnection(
+            self._host, timeout=REQUEST_TIMEOUT, context=self.ssl_context
+        )
+    
+    def _acquire_connection(self):
+        """Take an idle connection from the pool, or open a new one."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+    
+    def _release_connection(self, connection):
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+    
+    def _get(self, url):
+        """
+        Send a GET request over a pooled keep-alive connection.
+        
+        If the server has dropped the idle connection, the request is sent
+        once more on a fresh connection.
+        
+        Args:
+            url: Full URL to request
+            
+        Returns:
+            tuple: (response, body bytes)
+            
+        Raises:
+            Exception: For network errors
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        
+        for attempt in range(2):
+            connection = self._new_connection() if attempt else self._acquire_connection()
+            try:
+                connection.request("GET", path, headers=self.headers)
+                response = connection.getresponse()
+                # The body must be fully read before the connection can be reused
+                body = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                connection.close()
+                if attempt:
+                    raise Exception(f"Network error: {e}")
+                continue
+            
+            self._release_connection(connection)
+            return response, body
     
     def _make_request(self, url, max_retries=5):
         """
@@ -80,50 +260,37 @@ class OrdiscanClient:
             PermissionError: For 401/403 errors
             Exception: For other HTTP errors or network issues
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
-        
         retry_count = 0
         while retry_count < max_retries:
-            try:
-                request = urllib.request.Request(url, headers=headers)
-                with urllib.request.urlopen(request, context=self.ssl_context) as response:
-                    status = response.getcode()
-                    
-                    if status == 200:
-                        return json.loads(response.read().decode('utf-8'))
-                    elif status == 429:
-                        # Rate limit - exponential backoff
-                        retry_after = int(response.headers.get('Retry-After', 2 ** retry_count))
-                        wait_time = min(retry_after, 60)  # Cap at 60 seconds
-                        print(f"Rate limited (429). Waiting {wait_time} seconds before retry {retry_count + 1}/{max_retries}...")
-                        time.sleep(wait_time)
-                        retry_count += 1
-                    elif status == 401:
-                        raise PermissionError("Authentication failed (401). Check your API key.")
-                    elif status == 403:
-                        raise PermissionError("Access forbidden (403). Your API key may not have permission for this endpoint.")
-                    else:
-                        raise Exception(f"Unexpected HTTP status {status}: {response.read().decode('utf-8')}")
-                        
-            except urllib.error.HTTPError as e:
-                if e.code == 429:
-                    retry_after = int(e.headers.get('Retry-After', 2 ** retry_count))
-                    wait_time = min(retry_after, 60)
-                    print(f"Rate limited (429). Waiting {wait_time} seconds before retry {retry_count + 1}/{max_retries}...")
-                    time.sleep(wait_time)
-                    retry_count += 1
-                elif e.code == 401:
-                    raise PermissionError("Authentication failed (401). Check your API key.")
-                elif e.code == 403:
-                    raise PermissionError("Access forbidden (403). Your API key may not have permission for this endpoint.")
-                else:
-                    raise Exception(f"HTTP error {e.code}: {e.reason}")
-            except urllib.error.URLError as e:
-                raise Exception(f"Network error: {e.reason}")
+            with self._request_slots:
+                response, body = self._get(url)
+            status = response.status
+            
+            if status == 200:
+                if orjson is not None:
+                    return orjson.loads(body)
+                return json.loads(body.decode('utf-8'))
+            elif status == 429:
+                # Rate limit - exponential backoff
+                retry_after = int(response.headers.get('Retry-After', 2 ** retry_count))
+                # Honor the rate-limit reset time if the server provides one
+                reset = response.headers.get('X-RateLimit-Reset')
+                if reset and reset.isdigit():
+                    reset = int(reset)
+                    # Either a Unix timestamp or a number of seconds from now
+                    reset_in = reset - time.time() if reset > 1_000_000_000 else reset
+                    retry_after = max(retry_after, reset_in)
+                # Random jitter keeps concurrent workers from retrying in lockstep
+                wait_time = min(retry_after + random.uniform(0, 2 ** retry_count), 60)  # Cap at 60 seconds
+                print(f"Rate limited (429). Waiting {wait_time:.1f} seconds before retry {retry_count + 1}/{max_retries}...")
+                time.sleep(wait_time)
+                retry_count += 1
+            elif status == 401:
+                raise PermissionError("Authentication failed (401). Check your API key.")
+            elif status == 403:
+                raise PermissionError("Access forbidden (403). Your API key may not have permission for this endpoint.")
+            else:
+                raise Exception(f"HTTP error {status}: {response.reason}")
         
         raise Exception(f"Max retries ({max_retries}) exceeded due to rate limiting.")
     
@@ -137,81 +304,248 @@ class OrdiscanClient:
         Returns:
             dict: Transaction details with BTC amounts, or None if not found
         """
+        cache_path = self._transaction_cache_path(txid)
+        if cache_path and not self.refresh:
+            cached = _read_json_file(cache_path)
+            if cached is not None:
+                return cached
+        
         endpoint = TRANSACTION_DETAILS_ENDPOINT.format(txid=txid)
         url = f"{self.base_url}{endpoint}"
         
         try:
-            return self._make_request(url)
+            details = self._make_request(url)
         except Exception as e:
             # If transaction details endpoint doesn't exist or fails, return None
             # This allows the code to continue without BTC amounts
             return None
+        
+        # Only confirmed transactions are immutable; mempool entries may still change
+        if cache_path and is_confirmed(details):
+            _write_json_file(cache_path, details)
+        
+        return details
+    
+    def _transaction_cache_path(self, txid):
+        """Return the cache file path for a txid, or None if caching is disabled."""
+        if not self.cache_dir or not txid:
+            return None
+        return os.path.join(self.cache_dir, txid[:2], f"{txid}.json")
+    
+    def _response_cache_path(self, url):
+        """Return the cache file path for a URL, or None if caching is disabled."""
+        if not self.response_cache_dir:
+            return None
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.response_cache_dir, key[:2], f"{key}.json")
+    
+    def _read_cached_response(self, url):
+        """Return the cached response for a URL, or None if missing or expired."""
+        cache_path = self._response_cache_path(url)
+        if not cache_path or self.refresh:
+            return None
+        try:
+            if time.time() - os.path.getmtime(cache_path) > RESPONSE_CACHE_TTL:
+                return None
+        except OSError:
+            return None
+        return _read_json_file(cache_path)
+    
+    def _fetch_activity_page(self, url, use_cache):
+        """
+        Fetch one activity page, optionally serving it from the response cache.
+        
+        Successful responses are written to the cache; errors are not. A
+        cache write that fails only skips caching that page, so it never
+        turns a fetched page into a page error.
+        """
+        if use_cache:
+            cached = self._read_cached_response(url)
+            if cached is not None:
+                return cached
+        
+        data = self._make_request(url)
+        cache_path = self._response_cache_path(url)
+        if cache_path:
+            _write_json_file(cache_path, data)
+        return data
+    
+    def iter_transactions_details(self, txids, max_workers=MAX_CONCURRENT_REQUESTS):
+        """
+        Fetch details for many transactions concurrently, yielding each
+        result as soon as it arrives.
+        
+        Lookups are network-bound, so up to max_workers requests are kept in
+        flight at once instead of waiting on each round-trip in turn. Each
+        txid is fetched once. A lookup that raises yields its exception, so
+        one failure doesn't abort the rest of the batch.
+        
+        Args:
+            txids: Iterable of transaction IDs
+            max_workers: Maximum number of simultaneous requests
+            
+        Yields:
+            tuple: (txid, result) in completion order, where result is the
+            details, None if not found, or the exception raised
+        """
+        unique_txids = list(dict.fromkeys(txids))
+        if not unique_txids:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_txids))) as executor:
+            futures = {executor.submit(self.fetch_transaction_details, txid): txid for txid in unique_txids}
+            try:
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = e
+                    yield futures[future], result
+            finally:
+                # Don't start lookups nobody will read if the caller stops early
+                for future in futures:
+                    future.cancel()
     
     def fetch_address_activity(self, address):
         """
         Fetch all activity/transactions for a Bitcoin address with pagination.
         
+        An error on the first page is raised; an error on a later page stops
+        pagination, keeping the items fetched so far.
+        
         Args:
             address: Bitcoin address (e.g., bc1...)
             
         Returns:
             list: All transactions/activity items
         """
-        endpoint = ADDRESS_ACTIVITY_ENDPOINT.format(address=address)
         all_items = []
-        page = 1
+        pages_fetched = 0
+        try:
+            for _, items in self.iter_address_pages(address):
+                pages_fetched += 1
+                all_items.extend(items)
+        except Exception as e:
+            # If it's a permission error or an error on the first page, re-raise
+            if isinstance(e, PermissionError) or pages_fetched == 0:
+                raise
+            # For later pages, log and stop
+            print(f"\n  Warning: {e}")
+            print(f"  Stopping pagination. Collected {len(all_items)} items so far.")
+            print(f"Total items fetched: {len(all_items)}")
         
-        print(f"Fetching activity for address: {address}")
+        return all_items
+    
+    def iter_address_pages(self, address, start_page=1):
+        """
+        Yield the activity for a Bitcoin address one page at a time.
         
-        while True:
-            # Build URL with pagination
-            # Common pagination patterns: ?page=N or ?offset=N&limit=M
-            # Adjust based on Ordiscan API docs
-            url = f"{self.base_url}{endpoint}?page={page}"
+        Ordiscan pagination is deterministic, so (address, page) identifies
+        a page's contents; start_page lets an interrupted export resume after
+        the last page it saved. Any error fetching a page is raised.
+        
+        The first page is fetched on its own. If more pages follow, they are
+        requested PAGE_FETCH_WINDOW at a time in parallel and processed in
+        order; pages past the end of the data are discarded.
+        
+        The first page is always fetched live. Later pages are served from
+        the response cache only when the first page is unchanged since it was
+        cached, since new activity shifts the contents of every page. The page
+        that ends pagination is also re-fetched live in case it has grown.
+        
+        Args:
+            address: Bitcoin address (e.g., bc1...)
+            start_page: Page number to start from
             
-            try:
-                print(f"  Fetching page {page}...", end=" ", flush=True)
-                data = self._make_request(url)
-                
-                # Handle different response structures
-                # Common patterns: data.data, data.results, data.items, or just data
-                items = None
-                if isinstance(data, dict):
-                    items = data.get('data', data.get('results', data.get('items', [])))
-                    # Check if there's a pagination indicator
-                    has_more = data.get('has_more', data.get('next', None) is not None)
-                elif isinstance(data, list):
-                    items = data
-                    has_more = len(items) > 0
-                else:
-                    raise Exception(f"Unexpected response format: {type(data)}")
-                
-                if not items or len(items) == 0:
-                    print("done (no more data)")
-                    break
-                
-                all_items.extend(items)
-                print(f"done ({len(items)} items)")
+        Yields:
+            tuple: (page number, list of items) in page order
+        """
+        endpoint = ADDRESS_ACTIVITY_ENDPOINT.format(address=address)
+        total_items = 0
+        page = start_page
+        window = 1
+        done = False
+        use_cache = False
+        # Cached pages can only be validated against a live first page
+        cached_first_page = None
+        if start_page == 1:
+            cached_first_page = self._read_cached_response(f"{self.base_url}{endpoint}?page=1")
+        
+        print(f"Fetching activity for address: {address}")
+        
+        with ThreadPoolExecutor(max_workers=PAGE_FETCH_WINDOW) as executor:
+            while not done:
+                # Build URLs with pagination
+                # Common pagination patterns: ?page=N or ?offset=N&limit=M
+                # Adjust based on Ordiscan API docs
+                pages = range(page, page + window)
+                urls = [f"{self.base_url}{endpoint}?page={p}" for p in pages]
+                futures = [executor.submit(self._fetch_activity_page, url, use_cache) for url in urls]
                 
-                # Check if we should continue paginating
-                # If response doesn't indicate more pages, stop after empty page
-                if not has_more:
-                    break
+                for current_page, url, future in zip(pages, urls, futures):
+                    try:
+                        print(f"  Fetching page {current_page}...", end=" ", flush=True)
+                        data = future.result()
+                        if current_page == 1:
+                            use_cache = cached_first_page is not None and data == cached_first_page
+                        items, has_more = self._parse_activity_page(data)
+                        
+                        # The last page may have grown since it was cached, so
+                        # whichever page ends pagination is always checked live
+                        if use_cache and current_page > 1 and (not items or not has_more):
+                            items, has_more = self._parse_activity_page(
+                                self._fetch_activity_page(url, use_cache=False)
+                            )
+                        
+                        if not items or len(items) == 0:
+                            print("done (no more data)")
+                            done = True
+                            break
+                        
+                        total_items += len(items)
+                        print(f"done ({len(items)} items)")
+                        yield current_page, items
+                        
+                        # Check if we should continue paginating
+                        # If response doesn't indicate more pages, stop after empty page
+                        if not has_more:
+                            done = True
+                            break
+                        
+                    except Exception as e:
+                        # If it's a permission error or other critical error, re-raise
+                        if isinstance(e, PermissionError):
+                            raise
+                        if current_page == 1:
+                            raise Exception(f"Failed to fetch first page: {e}")
+                        raise Exception(f"Error on page {current_page}: {e}")
                 
-                page += 1
+                # Drop speculative requests for pages past the end
+                for future in futures:
+                    future.cancel()
                 
-            except Exception as e:
-                # If it's a permission error or other critical error, re-raise
-                if isinstance(e, PermissionError):
-                    raise
-                # For other errors on first page, raise immediately
-                if page == 1:
-                    raise Exception(f"Failed to fetch first page: {e}")
-                # For later pages, log and stop
-                print(f"\n  Warning: Error on page {page}: {e}")
-                print(f"  Stopping pagination. Collected {len(all_items)} items so far.")
-                break
+                page += window
+                window = PAGE_FETCH_WINDOW
         
-        print(f"Total items fetched: {len(all_items)}")
-        return all_items
-
+        print(f"Total items fetched: {total_items}")
+    
+    @staticmethod
+    def _parse_activity_page(data):
+        """
+        Extract the items and pagination flag from one activity page.
+        
+        Returns:
+            tuple: (items, has_more)
+        """
+        # Handle different response structures
+        # Common patterns: data.data, data.results, data.items, or just data
+        if isinstance(data, dict):
+            items = data.get('data', data.get('results', data.get('items', [])))
+            # Check if there's a pagination indicator
+            has_more = data.get('has_more', data.get('next', None) is not None)
+        elif isinstance(data, list):
+            items = data
+            has_more = len(items) > 0
+        else:
+            raise Exception(f"Unexpected response format: {type(data)}")
+        return items, has_more
@@ -18,8 +18,16 @@ import sys
 import json
 import csv
 import argparse
+import hashlib
+import itertools
+import pathlib
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
 # Ensure we can import from the same directory
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 if _script_dir not in sys.path:
@@ -68,11 +76,22 @@ def get_api_key():
     return None
 
 
+# Candidate field names, checked in order, for values that vary between API responses
+_TIMESTAMP_FIELDS = ('timestamp', 'time', 'created_at', 'date', 'block_time')
+_BTC_AMOUNT_FIELDS = ('btc_amount', 'amount', 'value', 'sats', 'satoshis')
+_SATOSHI_FIELDS = frozenset({'sats', 'satoshis'})
+
+# Direction labels used by different APIs
+_DIRECTION_IN = frozenset({'in', 'incoming', 'receive', 'received'})
+_DIRECTION_OUT = frozenset({'out', 'outgoing', 'send', 'sent'})
+_DIRECTION_SELF = frozenset({'self', 'internal'})
+
+
 def extract_timestamp(item):
     """Extract timestamp from various possible field names."""
-    for field in ['timestamp', 'time', 'created_at', 'date', 'block_time']:
-        if field in item and item[field]:
-            ts = item[field]
+    for field in _TIMESTAMP_FIELDS:
+        ts = item.get(field)
+        if ts:
             # Handle Unix timestamp (int or float)
             if isinstance(ts, (int, float)):
                 return int(ts)
@@ -93,11 +112,11 @@ def determine_direction(item, address):
     """
     # Check common field names
     direction = item.get('direction', item.get('type', item.get('tx_type', ''))).lower()
-    if direction in ['in', 'incoming', 'receive', 'received']:
+    if direction in _DIRECTION_IN:
         return 'in'
-    elif direction in ['out', 'outgoing', 'send', 'sent']:
+    elif direction in _DIRECTION_OUT:
         return 'out'
-    elif direction in ['self', 'internal']:
+    elif direction in _DIRECTION_SELF:
         return 'self'
     
     # Try to infer from amount (negative = out, positive = in)
@@ -113,122 +132,204 @@ def determine_direction(item, address):
 
 def extract_btc_amount(item):
     """Extract BTC amount from various possible field names."""
-    for field in ['btc_amount', 'amount', 'value', 'sats', 'satoshis']:
-        if field in item:
-            val = item[field]
-            if isinstance(val, (int, float)):
-                # If it's in satoshis, convert to BTC
-                if field in ['sats', 'satoshis']:
-                    return val / 100000000
-                return val
+    for field in _BTC_AMOUNT_FIELDS:
+        val = item.get(field)
+        if isinstance(val, (int, float)):
+            # If it's in satoshis, convert to BTC
+            if field in _SATOSHI_FIELDS:
+                return val / 100000000
+            return val
     return 0.0
 
 
-def save_raw_json(address, data, output_dir):
-    """Save raw JSON response."""
-    os.makedirs(output_dir, exist_ok=True)
-    filepath = os.path.join(output_dir, f"{address}_raw.json")
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"Saved raw JSON to: {filepath}")
-    return filepath
+def extract_txid(item):
+    """Extract the transaction ID from various possible field names."""
+    return item.get('txid', item.get('tx_id', item.get('hash', item.get('transaction_hash', ''))))
+
 
+def extract_fee(item):
+    """Extract the fee, converting values that look like satoshis to BTC."""
+    fee = item.get('fee', item.get('fee_btc', item.get('fee_sats', 0)))
+    if isinstance(fee, int) and fee > 1000:  # Likely in satoshis
+        fee = fee / 100000000
+    return fee
 
-def save_transactions_csv(address, transactions, output_dir):
-    """Save transactions as CSV with required columns."""
-    os.makedirs(output_dir, exist_ok=True)
-    filepath = os.path.join(output_dir, f"{address}_transactions.csv")
+
+def normalize_transaction(item, address):
+    """
+    Extract the derived fields used by the CSV and summary outputs in one pass.
     
-    fieldnames = [
-        'timestamp', 'date', 'txid', 'direction', 'btc_amount',
-        'fee_btc', 'block_height', 'confirmations', 'note', 'raw_type'
-    ]
+    Returns:
+        tuple: (timestamp, direction, btc_amount, fee)
+    """
+    return (
+        extract_timestamp(item),
+        determine_direction(item, address),
+        extract_btc_amount(item),
+        extract_fee(item),
+    )
+
+
+def checkpoint_paths(address, output_dir):
+    """Return the (items, state) checkpoint file paths for an address."""
+    return output_dir / f"{address}.partial.jsonl", output_dir / f"{address}.partial.json"
+
+
+def page_fingerprint(items):
+    """
+    Identify a page of activity by its txids, so a checkpoint can tell
+    whether new activity has shifted the pages since it was written.
+    Items without a txid are identified by their full contents.
+    """
+    digest = hashlib.sha256()
+    for item in items:
+        key = extract_txid(item) or json.dumps(item, sort_keys=True)
+        digest.update(str(key).encode('utf-8') + b'\n')
+    return digest.hexdigest()
+
+
+def fetch_activity_with_checkpoint(client, address, output_dir):
+    """
+    Fetch an address's activity to a JSON Lines file, checkpointing after
+    every page.
     
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    Each fetched page is appended to <address>.partial.jsonl, and the page
+    number, file size and page_fingerprint() of page 1 are recorded in
+    <address>.partial.json. If a previous export was interrupted, page 1 is
+    fetched again first: new activity shifts the contents of every page, so
+    fetching resumes after the last saved page only when page 1 is
+    unchanged. Otherwise the checkpoint is discarded and the export starts
+    over. Call clear_checkpoint() once the outputs have been written.
+    
+    Returns:
+        pathlib.Path: The JSON Lines file holding every item
+    """
+    partial_path, state_path = checkpoint_paths(address, output_dir)
+    
+    state = None
+    if os.path.exists(state_path) and os.path.exists(partial_path):
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    
+    pages = client.iter_address_pages(address)
+    if state is not None:
+        first = next(pages, None)
+        if first is not None and page_fingerprint(first[1]) == state.get('first_page'):
+            pages.close()
+            print(f"Resuming export for {address} after page {state['page']}")
+            pages = client.iter_address_pages(address, start_page=state['page'] + 1)
+        else:
+            print(f"Activity for {address} changed since the last checkpoint; starting over")
+            state = None
+            # Keep the page 1 just fetched rather than requesting it again
+            pages = itertools.chain([first] if first is not None else [], pages)
+    
+    offset = state['offset'] if state else 0
+    first_page = state['first_page'] if state else None
+    
+    with open(partial_path, 'a+b') as partial:
+        # Drop anything written after the last checkpoint (e.g. a half-saved
+        # page), or everything if the checkpoint was discarded
+        partial.truncate(offset)
         
-        for item in transactions:
-            timestamp = extract_timestamp(item)
-            date_str = ''
-            if timestamp > 0:
-                try:
-                    date_str = datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-                except:
-                    date_str = ''
-            
-            txid = item.get('txid', item.get('tx_id', item.get('hash', item.get('transaction_hash', ''))))
-            direction = determine_direction(item, address)
-            btc_amount = extract_btc_amount(item)
-            
-            # Extract fee
-            fee_btc = item.get('fee', item.get('fee_btc', item.get('fee_sats', 0)))
-            if isinstance(fee_btc, int) and fee_btc > 1000:  # Likely in satoshis
-                fee_btc = fee_btc / 100000000
-            
-            block_height = item.get('block_height', item.get('height', item.get('block', '')))
-            confirmations = item.get('confirmations', item.get('confirmation_count', ''))
-            note = item.get('note', item.get('memo', item.get('description', '')))
-            raw_type = item.get('type', item.get('tx_type', item.get('kind', '')))
+        for page, items in pages:
+            if page == 1:
+                first_page = page_fingerprint(items)
+            if orjson is not None:
+                partial.write(b''.join(orjson.dumps(item) + b'\n' for item in items))
+            else:
+                partial.write(''.join(json.dumps(item, ensure_ascii=False) + '\n' for item in items).encode('utf-8'))
+            partial.flush()
             
-            writer.writerow({
-                'timestamp': timestamp,
-                'date': date_str,
-                'txid': txid,
-                'direction': direction,
-                'btc_amount': btc_amount,
-                'fee_btc': fee_btc,
-                'block_height': block_height,
-                'confirmations': confirmations,
-                'note': str(note) if note else '',
-                'raw_type': str(raw_type) if raw_type else ''
-            })
+            tmp_path = f"{state_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'page': page, 'offset': partial.tell(), 'first_page': first_page}, f)
+            os.replace(tmp_path, state_path)
     
-    print(f"Saved CSV to: {filepath}")
+    return partial_path
+
+
+def clear_checkpoint(address, output_dir):
+    """Remove an address's checkpoint files."""
+    for path in checkpoint_paths(address, output_dir):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def iter_jsonl(filepath):
+    """Yield the items of a JSON Lines file one at a time."""
+    with open(filepath, 'rb') as f:
+        for line in f:
+            yield orjson.loads(line) if orjson is not None else json.loads(line)
+
+
+def save_raw_json(address, data, output_dir):
+    """
+    Save raw JSON response.
+    
+    data may be any iterable of items; they are written one at a time, so a
+    generator is never materialized. The file has the same layout as
+    json.dump(indent=2) and is encoded with orjson when it is installed.
+    output_dir is a pathlib.Path to an existing directory.
+    """
+    filepath = output_dir / f"{address}_raw.json"
+    with open(filepath, 'wb') as f:
+        separator = b'[\n  '
+        for item in data:
+            f.write(separator)
+            if orjson is not None:
+                encoded = orjson.dumps(item, option=orjson.OPT_INDENT_2)
+            else:
+                encoded = json.dumps(item, indent=2, ensure_ascii=False).encode('utf-8')
+            f.write(encoded.replace(b'\n', b'\n  '))
+            separator = b',\n  '
+        f.write(b'[]' if separator == b'[\n  ' else b'\n]')
+    print(f"Saved raw JSON to: {filepath}")
     return filepath
 
 
-def save_summary(address, transactions, output_dir):
-    """Save summary statistics."""
-    os.makedirs(output_dir, exist_ok=True)
-    filepath = os.path.join(output_dir, f"{address}_summary.txt")
+def csv_row(item, normalized):
+    """
+    Build a transactions CSV row as a tuple in the column order of the header.
     
-    total_transactions = len(transactions)
+    Args:
+        item: Raw transaction dict
+        normalized: normalize_transaction() result for the item
+    """
+    timestamp, direction, btc_amount, fee_btc = normalized
+    date_str = ''
+    if timestamp > 0:
+        try:
+            date_str = datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        except:
+            date_str = ''
     
-    if total_transactions == 0:
-        date_range = "N/A"
-        total_btc_received = 0.0
-        total_btc_sent = 0.0
-        total_fees = 0.0
-    else:
-        # Extract timestamps and calculate date range
-        timestamps = [extract_timestamp(tx) for tx in transactions if extract_timestamp(tx) > 0]
-        if timestamps:
-            min_date = datetime.fromtimestamp(min(timestamps), timezone.utc)
-            max_date = datetime.fromtimestamp(max(timestamps), timezone.utc)
-            date_range = f"{min_date.strftime('%Y-%m-%d')} to {max_date.strftime('%Y-%m-%d')}"
-        else:
-            date_range = "N/A"
-        
-        # Calculate totals
-        total_btc_received = 0.0
-        total_btc_sent = 0.0
-        total_fees = 0.0
-        
-        for tx in transactions:
-            amount = extract_btc_amount(tx)
-            direction = determine_direction(tx, address)
-            
-            if direction == 'in':
-                total_btc_received += abs(amount)
-            elif direction == 'out':
-                total_btc_sent += abs(amount)
-            
-            fee = tx.get('fee', tx.get('fee_btc', tx.get('fee_sats', 0)))
-            if isinstance(fee, (int, float)):
-                if fee > 1000:  # Likely in satoshis
-                    fee = fee / 100000000
-                total_fees += abs(fee)
+    txid = extract_txid(item)
+    block_height = item.get('block_height', item.get('height', item.get('block', '')))
+    confirmations = item.get('confirmations', item.get('confirmation_count', ''))
+    note = item.get('note', item.get('memo', item.get('description', '')))
+    raw_type = item.get('type', item.get('tx_type', item.get('kind', '')))
+    
+    return (
+        timestamp,
+        date_str,
+        txid,
+        direction,
+        btc_amount,
+        fee_btc,
+        block_height,
+        confirmations,
+        str(note) if note else '',
+        str(raw_type) if raw_type else ''
+    )
+
+
+def save_summary(address, output_dir, total_transactions, date_range,
+                 total_btc_received, total_btc_sent, total_fees):
+    """
+    Save summary statistics from totals accumulated by write_outputs().
+    """
+    filepath = output_dir / f"{address}_summary.txt"
     
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write(f"Address Activity Summary\n")
@@ -245,6 +346,71 @@ def save_summary(address, transactions, output_dir):
     return filepath
 
 
+def write_outputs(address, transactions, output_dir):
+    """
+    Write the transactions CSV and the summary in a single pass.
+    
+    Each transaction is normalized once; its CSV row is written and the
+    summary totals are updated as it streams past, so transactions may be
+    any iterable, such as iter_jsonl(). output_dir is a pathlib.Path to
+    an existing directory.
+    
+    Returns:
+        int: Number of transactions written
+    """
+    filepath = output_dir / f"{address}_transactions.csv"
+    
+    fieldnames = [
+        'timestamp', 'date', 'txid', 'direction', 'btc_amount',
+        'fee_btc', 'block_height', 'confirmations', 'note', 'raw_type'
+    ]
+    
+    count = 0
+    total_in = 0.0
+    total_out = 0.0
+    total_fees = 0.0
+    min_ts = None
+    max_ts = None
+    
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        
+        for item in transactions:
+            normalized = normalize_transaction(item, address)
+            writer.writerow(csv_row(item, normalized))
+            
+            timestamp, direction, amount, fee = normalized
+            count += 1
+            if timestamp > 0:
+                if min_ts is None or timestamp < min_ts:
+                    min_ts = timestamp
+                if max_ts is None or timestamp > max_ts:
+                    max_ts = timestamp
+            
+            if direction == 'in':
+                total_in += abs(amount)
+            elif direction == 'out':
+                total_out += abs(amount)
+            
+            if isinstance(fee, (int, float)):
+                if fee > 1000:  # Likely in satoshis
+                    fee = fee / 100000000
+                total_fees += abs(fee)
+    
+    print(f"Saved CSV to: {filepath}")
+    
+    if min_ts is not None:
+        min_date = datetime.fromtimestamp(min_ts, timezone.utc)
+        max_date = datetime.fromtimestamp(max_ts, timezone.utc)
+        date_range = f"{min_date.strftime('%Y-%m-%d')} to {max_date.strftime('%Y-%m-%d')}"
+    else:
+        date_range = "N/A"
+    
+    save_summary(address, output_dir, count, date_range, total_in, total_out, total_fees)
+    return count
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Fetch and export Bitcoin address activity from Ordiscan API",
@@ -269,6 +435,11 @@ Examples:
         default='output',
         help="Output directory (default: output)"
     )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help="Ignore cached API responses and any saved checkpoint, and fetch everything again"
+    )
     
     args = parser.parse_args()
     
@@ -285,20 +456,30 @@ Examples:
     
     # Initialize client and fetch data
     try:
-        client = OrdiscanClient(api_key)
-        transactions = client.fetch_address_activity(args.address)
+        output_dir = pathlib.Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        client = OrdiscanClient(api_key, refresh=args.refresh)
+        if args.refresh:
+            clear_checkpoint(args.address, output_dir)
+        jsonl_path = fetch_activity_with_checkpoint(client, args.address, output_dir)
         
-        if not transactions:
+        if os.path.getsize(jsonl_path) == 0:
+            clear_checkpoint(args.address, output_dir)
             print(f"\nNo transactions found for address: {args.address}")
             sys.exit(0)
         
-        # Save outputs
+        # Save outputs. Items were written to the checkpoint's JSON Lines
+        # file as pages arrived and each output streams them back from it,
+        # so no output holds more than one item in memory. The checkpoint is
+        # cleared only once the outputs are written, so a crash while writing
+        # them resumes without refetching.
         print(f"\nSaving outputs to {args.output_dir}/...")
-        save_raw_json(args.address, transactions, args.output_dir)
-        save_transactions_csv(args.address, transactions, args.output_dir)
-        save_summary(args.address, transactions, args.output_dir)
+        save_raw_json(args.address, iter_jsonl(jsonl_path), output_dir)
+        total_transactions = write_outputs(args.address, iter_jsonl(jsonl_path), output_dir)
+        clear_checkpoint(args.address, output_dir)
         
-        print(f"\n✓ Successfully exported {len(transactions)} transactions for {args.address}")
+        print(f"\n✓ Successfully exported {total_transactions} transactions for {args.address}")
         
     except PermissionError as e:
         print(f"\n✗ Authentication Error: {e}", file=sys.stderr)
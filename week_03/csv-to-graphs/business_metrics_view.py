@@ -1,138 +1,126 @@
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Render straight to file; no GUI backend is needed
 import matplotlib.pyplot as plt
 import warnings
 
-# Load the dataset
-df = pd.read_csv('sample_hr_dataset.csv')
-
-# Set up the figure with subplots
-fig, axes = plt.subplots(3, 3, figsize=(20, 15))
-fig.suptitle('HR Business Metrics Dashboard', fontsize=20, fontweight='bold', y=0.995)
-
-# 1. Department Distribution
-if 'Department' in df.columns:
-    ax1 = axes[0, 0]
-    dept_counts = df['Department'].value_counts()
-    colors1 = plt.cm.Set3(range(len(dept_counts)))
-    ax1.pie(dept_counts.values, labels=dept_counts.index, autopct='%1.1f%%', 
-            startangle=90, colors=colors1)
-    ax1.set_title('Employee Distribution by Department', fontsize=12, fontweight='bold', pad=10)
-else:
-    axes[0, 0].text(0.5, 0.5, 'Department data not available', 
-                    ha='center', va='center', transform=axes[0, 0].transAxes)
-    axes[0, 0].set_title('Employee Distribution by Department', fontsize=12, fontweight='bold')
-
-# 2. Employment Status
-if 'EmploymentStatus' in df.columns:
-    ax2 = axes[0, 1]
-    emp_status = df['EmploymentStatus'].value_counts()
-    colors2 = ['#66b3ff', '#ff9999', '#99ff99']
-    ax2.pie(emp_status.values, labels=emp_status.index, autopct='%1.1f%%', 
-            startangle=90, colors=colors2[:len(emp_status)])
-    ax2.set_title('Employment Status Distribution', fontsize=12, fontweight='bold', pad=10)
-else:
-    axes[0, 1].text(0.5, 0.5, 'Employment Status data not available', 
-                    ha='center', va='center', transform=axes[0, 1].transAxes)
-    axes[0, 1].set_title('Employment Status Distribution', fontsize=12, fontweight='bold')
-
-# 3. Performance Score Distribution
-if 'PerformanceScore' in df.columns:
-    ax3 = axes[0, 2]
-    perf_scores = df['PerformanceScore'].value_counts()
-    colors3 = ['#ff6b6b', '#4ecdc4', '#95e1d3', '#f38181']
-    ax3.pie(perf_scores.values, labels=perf_scores.index, autopct='%1.1f%%', 
-            startangle=90, colors=colors3[:len(perf_scores)])
-    ax3.set_title('Performance Score Distribution', fontsize=12, fontweight='bold', pad=10)
-else:
-    axes[0, 2].text(0.5, 0.5, 'Performance Score data not available', 
-                    ha='center', va='center', transform=axes[0, 2].transAxes)
-    axes[0, 2].set_title('Performance Score Distribution', fontsize=12, fontweight='bold')
-
-# 4. Recruitment Source Distribution
-if 'RecruitmentSource' in df.columns:
-    ax4 = axes[1, 0]
-    recruit_source = df['RecruitmentSource'].value_counts()
-    colors4 = plt.cm.Pastel1(range(len(recruit_source)))
-    ax4.pie(recruit_source.values, labels=recruit_source.index, autopct='%1.1f%%', 
-            startangle=90, colors=colors4)
-    ax4.set_title('Recruitment Source Distribution', fontsize=12, fontweight='bold', pad=10)
-else:
-    axes[1, 0].text(0.5, 0.5, 'Recruitment Source data not available', 
-                    ha='center', va='center', transform=axes[1, 0].transAxes)
-    axes[1, 0].set_title('Recruitment Source Distribution', fontsize=12, fontweight='bold')
-
-# 5. Marital Status Distribution
-if 'MaritalDesc' in df.columns:
-    ax5 = axes[1, 1]
-    marital_status = df['MaritalDesc'].value_counts()
-    colors5 = plt.cm.Accent(range(len(marital_status)))
-    ax5.pie(marital_status.values, labels=marital_status.index, autopct='%1.1f%%', 
-            startangle=90, colors=colors5)
-    ax5.set_title('Marital Status Distribution', fontsize=12, fontweight='bold', pad=10)
-else:
-    axes[1, 1].text(0.5, 0.5, 'Marital Status data not available', 
-                    ha='center', va='center', transform=axes[1, 1].transAxes)
-    axes[1, 1].set_title('Marital Status Distribution', fontsize=12, fontweight='bold')
-
-# 6. Gender Distribution
-if 'Sex' in df.columns:
-    ax6 = axes[1, 2]
-    gender_counts = df['Sex'].value_counts()
-    colors6 = ['#ffb3ba', '#bae1ff']
-    ax6.pie(gender_counts.values, labels=gender_counts.index, autopct='%1.1f%%', 
-            startangle=90, colors=colors6[:len(gender_counts)])
-    ax6.set_title('Gender Distribution', fontsize=12, fontweight='bold', pad=10)
-else:
-    axes[1, 2].text(0.5, 0.5, 'Gender data not available', 
-                    ha='center', va='center', transform=axes[1, 2].transAxes)
-    axes[1, 2].set_title('Gender Distribution', fontsize=12, fontweight='bold')
-
-# 7. Termination Reasons (for terminated employees only)
-if 'TermReason' in df.columns:
-    ax7 = axes[2, 0]
-    term_reasons = df[df['TermReason'] != 'N/A-StillEmployed']['TermReason'].value_counts()
-    if len(term_reasons) > 0:
-        colors7 = plt.cm.Reds(range(len(term_reasons)))
-        ax7.pie(term_reasons.values, labels=term_reasons.index, autopct='%1.1f%%', 
-                startangle=90, colors=colors7)
-        ax7.set_title('Termination Reasons', fontsize=12, fontweight='bold', pad=10)
-    else:
-        axes[2, 0].text(0.5, 0.5, 'No termination data available', 
-                        ha='center', va='center', transform=axes[2, 0].transAxes)
-        axes[2, 0].set_title('Termination Reasons', fontsize=12, fontweight='bold')
-else:
-    axes[2, 0].text(0.5, 0.5, 'Termination Reason data not available', 
-                    ha='center', va='center', transform=axes[2, 0].transAxes)
-    axes[2, 0].set_title('Termination Reasons', fontsize=12, fontweight='bold')
-
-# 8. Race/Ethnicity Distribution
-if 'RaceDesc' in df.columns:
-    ax8 = axes[2, 1]
-    race_counts = df['RaceDesc'].value_counts()
-    colors8 = plt.cm.Set2(range(len(race_counts)))
-    ax8.pie(race_counts.values, labels=race_counts.index, autopct='%1.1f%%', 
-            startangle=90, colors=colors8)
-    ax8.set_title('Race/Ethnicity Distribution', fontsize=12, fontweight='bold', pad=10)
-else:
-    axes[2, 1].text(0.5, 0.5, 'Race/Ethnicity data not available', 
-                    ha='center', va='center', transform=axes[2, 1].transAxes)
-    axes[2, 1].set_title('Race/Ethnicity Distribution', fontsize=12, fontweight='bold')
-
-# 9. Active vs Terminated (derived from Termd column)
-if 'Termd' in df.columns:
-    ax9 = axes[2, 2]
-    term_status = df['Termd'].map({0: 'Active', 1: 'Terminated'}).value_counts()
-    colors9 = ['#90EE90', '#FF6B6B']
-    ax9.pie(term_status.values, labels=term_status.index, autopct='%1.1f%%', 
-            startangle=90, colors=colors9)
-    ax9.set_title('Active vs Terminated Employees', fontsize=12, fontweight='bold', pad=10)
-else:
-    axes[2, 2].text(0.5, 0.5, 'Termination status data not available', 
-                    ha='center', va='center', transform=axes[2, 2].transAxes)
-    axes[2, 2].set_title('Active vs Terminated Employees', fontsize=12, fontweight='bold')
-
-plt.tight_layout(rect=[0, 0, 1, 0.99])
-plt.savefig('business_metrics_dashboard.png', dpi=300, bbox_inches='tight')
-plt.close()
+# Panels with more categories than this are drawn as horizontal bars
+MAX_PIE_SLICES = 4
+
+CATEGORICAL_COLUMNS = ['Department', 'EmploymentStatus', 'PerformanceScore', 'RecruitmentSource',
+                       'MaritalDesc', 'Sex', 'TermReason', 'RaceDesc']
+
+# Load only the columns the dashboard charts (skipping any the file lacks),
+# using the multithreaded pyarrow parser when it is installed
+available = pd.read_csv('sample_hr_dataset.csv', nrows=0).columns
+usecols = [column for column in CATEGORICAL_COLUMNS + ['Termd'] if column in available]
+try:
+    df = pd.read_csv('sample_hr_dataset.csv', usecols=usecols, dtype={'Termd': 'int8'},
+                     engine='pyarrow')
+except ImportError:
+    df = pd.read_csv('sample_hr_dataset.csv', usecols=usecols, dtype={'Termd': 'int8'})
+columns = set(df.columns)
+
+# Store the charted text columns as categoricals so value_counts works on
+# small integer codes instead of hashing Python strings. Categories keep
+# their order of first appearance so tied counts are ordered as before.
+for column in CATEGORICAL_COLUMNS:
+    if column in columns:
+        df[column] = df[column].astype(pd.CategoricalDtype(df[column].dropna().unique()))
+
+
+def terminated_only(series):
+    """Drop employees who are still employed (for termination reasons)."""
+    return series[series != 'N/A-StillEmployed']
+
+
+def active_vs_terminated(series):
+    """Label the 0/1 Termd flag as Active/Terminated."""
+    return series.map({0: 'Active', 1: 'Terminated'})
+
+
+# One panel per entry, laid out left-to-right, top-to-bottom:
+# (column, title, label used in "not available" messages, colors, transform)
+# colors is either a colormap (sampled per category) or a list of colors.
+PANELS = [
+    ('Department', 'Employee Distribution by Department', 'Department',
+     plt.cm.Set3, None),
+    ('EmploymentStatus', 'Employment Status Distribution', 'Employment Status',
+     ['#66b3ff', '#ff9999', '#99ff99'], None),
+    ('PerformanceScore', 'Performance Score Distribution', 'Performance Score',
+     ['#ff6b6b', '#4ecdc4', '#95e1d3', '#f38181'], None),
+    ('RecruitmentSource', 'Recruitment Source Distribution', 'Recruitment Source',
+     plt.cm.Pastel1, None),
+    ('MaritalDesc', 'Marital Status Distribution', 'Marital Status',
+     plt.cm.Accent, None),
+    ('Sex', 'Gender Distribution', 'Gender',
+     ['#ffb3ba', '#bae1ff'], None),
+    ('TermReason', 'Termination Reasons', 'Termination Reason',
+     plt.cm.Reds, terminated_only),
+    ('RaceDesc', 'Race/Ethnicity Distribution', 'Race/Ethnicity',
+     plt.cm.Set2, None),
+    ('Termd', 'Active vs Terminated Employees', 'Termination status',
+     ['#90EE90', '#FF6B6B'], active_vs_terminated),
+]
+
+
+def show_message(ax, message, title):
+    """Show a placeholder message in place of a chart."""
+    ax.text(0.5, 0.5, message, ha='center', va='center', transform=ax.transAxes)
+    ax.set_title(title, fontsize=12, fontweight='bold')
+
+
+def panel_colors(colors, n):
+    """Return n colors sampled evenly from a colormap, or the first n of a list."""
+    if callable(colors):
+        return colors(np.linspace(0, 1, n))
+    return colors[:n]
+
+
+def draw_pie(ax, counts, colors, title):
+    """Draw a pie chart of category counts."""
+    ax.pie(counts.values, labels=counts.index, autopct='%1.1f%%',
+           startangle=90, colors=colors)
+    ax.set_title(title, fontsize=12, fontweight='bold', pad=10)
+
+
+def draw_barh(ax, counts, colors, title):
+    """Draw a horizontal bar chart of category counts, largest at the top."""
+    ax.barh(counts.index.astype(str), counts.values, color=colors)
+    ax.invert_yaxis()
+    ax.set_xlabel('Employees')
+    ax.set_title(title, fontsize=12, fontweight='bold', pad=10)
+
+
+plt.ioff()
+with plt.rc_context({'figure.autolayout': False, 'path.simplify': True,
+                     'path.simplify_threshold': 1.0}):
+    # Set up the figure with subplots
+    fig, axes = plt.subplots(3, 3, figsize=(20, 15))
+    fig.suptitle('HR Business Metrics Dashboard', fontsize=20, fontweight='bold', y=0.995)
+
+    for ax, (column, title, label, colors, transform) in zip(axes.flat, PANELS):
+        if column not in columns:
+            show_message(ax, f'{label} data not available', title)
+            continue
+
+        series = df[column]
+        if transform is not None:
+            series = transform(series)
+        counts = series.value_counts()
+        # Categorical counts include categories removed by the transform
+        counts = counts[counts > 0]
+
+        if len(counts) > MAX_PIE_SLICES:
+            draw_barh(ax, counts, panel_colors(colors, len(counts)), title)
+        elif len(counts) > 0:
+            draw_pie(ax, counts, panel_colors(colors, len(counts)), title)
+        else:
+            show_message(ax, f'No {label.lower()} data available', title)
+
+    plt.tight_layout(rect=[0, 0, 1, 0.99])
+    plt.savefig('business_metrics_dashboard.png', dpi=150, bbox_inches='tight')
+plt.close(fig)
 print("Dashboard saved as 'business_metrics_dashboard.png'")
 
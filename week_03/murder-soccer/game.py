@@ -1,9 +1,13 @@
 import pygame
+import numpy as np
 import json
 import os
 import random
 import sys
 import math
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from types import MappingProxyType
 
 # Initialize Pygame
 pygame.init()
@@ -18,34 +22,65 @@ DARK_GRAY = (40, 40, 40)
 LIGHT_GRAY = (100, 100, 100)
 ORANGE = (255, 165, 0)
 
-class GameConfig:
-    """Loads and manages game configuration"""
-    def __init__(self):
+# Game logic advances in fixed steps of this many milliseconds (60 per second)
+UPDATE_STEP_MS = 1000 / 60
+# Most time one frame may catch up on, so a long stall doesn't freeze the game in updates
+MAX_CATCH_UP_MS = 5 * UPDATE_STEP_MS
+
+# C-level attribute getters for pulling one field from a whole entity list
+_get_rect = attrgetter('rect')
+_get_collected = attrgetter('collected')
+
+
+# Parsed config.json, shared read-only by every GameConfig
+_CONFIG_CACHE = None
+
+
+def _load_config():
+    """Parse config.json on first use and return the shared read-only copy"""
+    global _CONFIG_CACHE
+    if _CONFIG_CACHE is None:
         try:
             with open('config.json', 'r') as f:
-                self.data = json.load(f)
+                _CONFIG_CACHE = MappingProxyType(json.load(f))
         except FileNotFoundError:
             print("Error: config.json not found!")
             sys.exit(1)
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON in config.json: {e}")
             sys.exit(1)
+    return _CONFIG_CACHE
+
+
+class GameConfig:
+    """Loads and manages game configuration"""
+    def __init__(self):
+        self.data = _load_config()
         
         self.screen_width = self.data['screen_width']
         self.screen_height = self.data['screen_height']
         self.player_start_x = self.data['player_start_x']
         self.player_start_y = self.data['player_start_y']
+        self._levels_by_num = {level['level']: level for level in self.data['levels']}
         self.current_level = self.data['default_level']
+    
+    @property
+    def current_level(self):
+        """Level currently being played"""
+        return self._current_level
+    
+    @current_level.setter
+    def current_level(self, level_num):
+        # Cache the active level's config; it only changes with the level
+        self._current_level = level_num
+        self._current_level_cfg = self.get_level_config(level_num)
         
     def get_level_config(self, level_num=None):
         """Get configuration for a specific level"""
         if level_num is None:
-            level_num = self.current_level
+            return self._current_level_cfg
         
-        for level in self.data['levels']:
-            if level['level'] == level_num:
-                return level
-        return self.data['levels'][0]  # Return first level as default
+        return self._levels_by_num.get(level_num, self.data['levels'][0])  # First level is the default
 
 class HighScore:
     """Manages high score storage with player names"""
@@ -116,7 +151,7 @@ class Player:
         
         # Load and scale player image
         try:
-            self.original_image = pygame.image.load('assets/images/player.png')
+            self.original_image = pygame.image.load('assets/images/player.png').convert_alpha()
         except pygame.error as e:
             print(f"Error loading player image: {e}")
             sys.exit(1)
@@ -124,6 +159,10 @@ class Player:
         self.height = 60
         self.image = pygame.transform.scale(self.original_image, (self.width, self.height))
         
+        # Pre-rotate the image for every whole degree of tilt (angle is clamped to +/-30)
+        self._rot_cache = {deg: pygame.transform.rotate(self.image, -deg)
+                           for deg in range(-30, 31)}
+        
         self.x = x
         self.y = y
         self.velocity_y = 0
@@ -132,9 +171,9 @@ class Player:
         
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
     
-    def update(self, config):
+    def update(self, level_config, config):
         """Update player position and physics"""
-        self.level_config = config.get_level_config()
+        self.level_config = level_config
         
         # Apply gravity only if game has started
         if self.game_started:
@@ -155,7 +194,8 @@ class Player:
         # Update angle based on velocity
         self.angle = min(max(self.velocity_y * 3, -30), 30)
         
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
     
     def flap(self, config):
         """Make the player flap/jump"""
@@ -164,19 +204,24 @@ class Player:
         self.game_started = True
     
     def draw(self, screen):
-        """Draw the player"""
-        rotated_image = pygame.transform.rotate(self.image, -self.angle)
+        """Draw the player and return the screen area it covers"""
+        deg = max(-30, min(30, int(round(self.angle))))
+        rotated_image = self._rot_cache[deg]
         rect = rotated_image.get_rect(center=(self.x + self.width//2, self.y + self.height//2))
-        screen.blit(rotated_image, rect)
+        return screen.blit(rotated_image, rect)
 
 class Wall:
     """Wall/Obstacle class - apocalyptic soccer themed"""
+    width = 80
+    
+    # Full-height brick columns shared by every wall, built on first use
+    _brick_tiles = None
+    
     def __init__(self, x, config):
         self.config = config
         self.level_config = config.get_level_config()
         
-        # Wall dimensions
-        self.width = 80
+        # Gap dimensions
         self.gap_size = max(self.level_config['wall_gap_size'], 70)  # Ensure gap is at least 70px (larger than player)
         
         # Random gap position - ensure gap is always accessible
@@ -190,20 +235,30 @@ class Wall:
         self.bottom_rect = pygame.Rect(x, gap_y + self.gap_size, self.width, 
                                        config.screen_height - (gap_y + self.gap_size))
         
+        # Render each half once; draw() just blits the cached surfaces
+        if Wall._brick_tiles is None:
+            Wall._build_brick_tiles(self.width, config.screen_height)
+        self.top_surface = self._render_wall_section(self.top_rect.height)
+        self.bottom_surface = self._render_wall_section(self.bottom_rect.height)
+        
         self.x = x
-        self.passed = False
     
-    def update(self, config):
-        """Update wall position"""
-        self.level_config = config.get_level_config()
-        speed = self.level_config['wall_speed']
-        self.x -= speed
+    def update(self, x):
+        """Move the wall to x (Game.update advances all wall positions at once)"""
+        self.x = x
         
         self.top_rect.x = self.x
         self.bottom_rect.x = self.x
     
     def draw(self, screen):
-        """Draw realistic brick walls with mortar lines"""
+        """Draw realistic brick walls with mortar lines and return the screen
+        areas they cover"""
+        return [screen.blit(self.top_surface, self.top_rect),
+                screen.blit(self.bottom_surface, self.bottom_rect)]
+    
+    @classmethod
+    def _build_brick_tiles(cls, width, height, count=4):
+        """Pre-render a few brick columns for walls to take slices from"""
         # Brick colors - weathered and apocalyptic
         brick_colors = [
             (80, 60, 50),   # Dark brown
@@ -215,43 +270,63 @@ class Wall:
         brick_height = 20
         brick_width = 25
         
-        # Draw top wall bricks
-        self._draw_brick_wall(screen, self.top_rect, brick_colors, mortar_color, brick_width, brick_height)
+        tiles = []
+        for seed in range(count):
+            tile = pygame.Surface((width, height)).convert()
+            cls._draw_brick_wall(tile, tile.get_rect(), brick_colors, mortar_color,
+                                 brick_width, brick_height, np.random.default_rng(seed))
+            tiles.append(tile)
+        cls._brick_tiles = tiles
+    
+    def _render_wall_section(self, height):
+        """Render one half of the wall (bricks and goal posts) onto a surface"""
+        surface = pygame.Surface((self.width, max(0, height))).convert()
+        rect = surface.get_rect()
         
-        # Draw bottom wall bricks
-        self._draw_brick_wall(screen, self.bottom_rect, brick_colors, mortar_color, brick_width, brick_height)
+        # Take the bricks from the top of a shared tile
+        surface.blit(random.choice(self._brick_tiles), (0, 0), rect)
         
         # Add goal post details at the edges (metal bars)
-        pygame.draw.rect(screen, (120, 120, 120), 
-                        (self.top_rect.x, self.top_rect.y, 6, self.top_rect.height))
-        pygame.draw.rect(screen, (100, 100, 100),
-                        (self.top_rect.x, self.top_rect.y, 6, self.top_rect.height), 1)
-        pygame.draw.rect(screen, (120, 120, 120),
-                        (self.top_rect.x + self.width - 6, self.top_rect.y, 6, self.top_rect.height))
-        pygame.draw.rect(screen, (100, 100, 100),
-                        (self.top_rect.x + self.width - 6, self.top_rect.y, 6, self.top_rect.height), 1)
-        pygame.draw.rect(screen, (120, 120, 120),
-                        (self.bottom_rect.x, self.bottom_rect.y, 6, self.bottom_rect.height))
-        pygame.draw.rect(screen, (100, 100, 100),
-                        (self.bottom_rect.x, self.bottom_rect.y, 6, self.bottom_rect.height), 1)
-        pygame.draw.rect(screen, (120, 120, 120),
-                        (self.bottom_rect.x + self.width - 6, self.bottom_rect.y, 6, self.bottom_rect.height))
-        pygame.draw.rect(screen, (100, 100, 100),
-                        (self.bottom_rect.x + self.width - 6, self.bottom_rect.y, 6, self.bottom_rect.height), 1)
-    
-    def _draw_brick_wall(self, screen, rect, brick_colors, mortar_color, brick_width, brick_height):
-        """Helper method to draw a realistic brick wall"""
+        pygame.draw.rect(surface, (120, 120, 120), (0, 0, 6, rect.height))
+        pygame.draw.rect(surface, (100, 100, 100), (0, 0, 6, rect.height), 1)
+        pygame.draw.rect(surface, (120, 120, 120), (self.width - 6, 0, 6, rect.height))
+        pygame.draw.rect(surface, (100, 100, 100), (self.width - 6, 0, 6, rect.height), 1)
+        
+        return surface
+    
+    @staticmethod
+    def _draw_brick_wall(screen, rect, brick_colors, mortar_color, brick_width, brick_height, rng=None):
+        """Helper method to draw a realistic brick wall (rng is a NumPy Generator)"""
+        if rng is None:
+            rng = np.random.default_rng()
+        
         # Draw mortar background
         pygame.draw.rect(screen, mortar_color, rect)
         
+        # Sample every brick's random color and damage up front
+        n_rows = rect.height // (brick_height + 2) + 1
+        n_cols = (rect.width + brick_width) // (brick_width + 2) + 1
+        color_idx = rng.integers(0, len(brick_colors), size=(n_rows, n_cols))
+        damaged = rng.random((n_rows, n_cols)) < 0.1  # 10% chance for damage
+        damage_radius = rng.integers(2, 5, size=(n_rows, n_cols))
+        
+        # Highlight, shadow and damage shades for each brick color
+        variants = {color: (tuple(min(255, c + 20) for c in color),
+                            tuple(max(0, c - 20) for c in color),
+                            tuple(max(0, c - 30) for c in color))
+                    for color in brick_colors}
+        
         # Draw individual bricks in a staggered pattern
         y = rect.y
         row_offset = 0
+        row = 0
         while y < rect.y + rect.height:
             x = rect.x + row_offset
+            col = 0
             while x < rect.x + rect.width:
                 # Random brick color for variation
-                brick_color = random.choice(brick_colors)
+                brick_color = brick_colors[color_idx[row, col]]
+                highlight_color, shadow_color, damage_color = variants[brick_color]
                 
                 # Brick rectangle
                 brick_rect = pygame.Rect(x, y, brick_width, brick_height)
@@ -265,7 +340,6 @@ class Wall:
                 pygame.draw.rect(screen, brick_color, brick_rect)
                 
                 # Add highlight for depth
-                highlight_color = tuple(min(255, c + 20) for c in brick_color)
                 pygame.draw.line(screen, highlight_color, 
                                (brick_rect.x, brick_rect.y), 
                                (brick_rect.right, brick_rect.y), 1)
@@ -274,7 +348,6 @@ class Wall:
                                (brick_rect.x, brick_rect.bottom), 1)
                 
                 # Add shadow for depth
-                shadow_color = tuple(max(0, c - 20) for c in brick_color)
                 pygame.draw.line(screen, shadow_color,
                                (brick_rect.right, brick_rect.y),
                                (brick_rect.right, brick_rect.bottom), 1)
@@ -283,42 +356,35 @@ class Wall:
                                (brick_rect.right, brick_rect.bottom), 1)
                 
                 # Add some texture/damage randomly
-                if random.random() < 0.1:  # 10% chance for damage
-                    damage_color = tuple(max(0, c - 30) for c in brick_color)
+                if damaged[row, col]:
                     pygame.draw.circle(screen, damage_color,
                                      (brick_rect.x + brick_rect.width//2,
                                       brick_rect.y + brick_rect.height//2),
-                                     random.randint(2, 4))
+                                     int(damage_radius[row, col]))
                 
                 x += brick_width + 2  # 2px mortar gap
+                col += 1
             
             # Stagger next row
             row_offset = -brick_width // 2 if row_offset == 0 else 0
             y += brick_height + 2  # 2px mortar gap
-    
-    def check_collision(self, player_rect):
-        """Check if player collides with wall"""
-        return self.top_rect.colliderect(player_rect) or self.bottom_rect.colliderect(player_rect)
-    
-    def is_off_screen(self):
-        """Check if wall is off screen"""
-        return self.x + self.width < 0
+            row += 1
 
 class Enemy:
     """Enemy class - flies toward the player"""
+    width = 50
+    height = 50
+    
+    # Scaled, display-format enemy image shared by every enemy, loaded on first use
+    _scaled_image = None
+    
     def __init__(self, x, y, config):
         self.config = config
         self.level_config = config.get_level_config()
         
-        # Load and scale enemy image
-        try:
-            self.original_image = pygame.image.load('assets/images/enemy.png')
-        except pygame.error as e:
-            print(f"Error loading enemy image: {e}")
-            sys.exit(1)
-        self.width = 50
-        self.height = 50
-        self.image = pygame.transform.scale(self.original_image, (self.width, self.height))
+        if Enemy._scaled_image is None:
+            Enemy._load_image(self.width, self.height)
+        self.image = self._scaled_image
         
         self.x = x
         self.y = y
@@ -331,14 +397,21 @@ class Enemy:
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
         self.start_y = y
     
-    def update(self, player_x, player_y, config):
-        """Update enemy position - moves toward player"""
-        self.level_config = config.get_level_config()
+    @classmethod
+    def _load_image(cls, width, height):
+        """Load and scale the enemy image once for all enemies"""
+        try:
+            original_image = pygame.image.load('assets/images/enemy.png').convert_alpha()
+        except pygame.error as e:
+            print(f"Error loading enemy image: {e}")
+            sys.exit(1)
+        cls._scaled_image = pygame.transform.scale(original_image, (width, height))
+    
+    def update(self, x, level_config, config):
+        """Update enemy position - Game.update moves it toward the player horizontally"""
+        self.level_config = level_config
         self.speed = self.level_config['enemy_speed']
-        
-        # Move toward player horizontally
-        if self.x > player_x:
-            self.x -= self.speed
+        self.x = x
         
         # Add vertical oscillation
         self.y += self.vertical_speed
@@ -353,35 +426,34 @@ class Enemy:
             self.y = config.screen_height - self.height
             self.vertical_speed *= -1
         
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
     
     def draw(self, screen):
-        """Draw the enemy"""
-        screen.blit(self.image, (self.x, self.y))
-    
-    def check_collision(self, player_rect):
-        """Check if enemy collides with player"""
-        return self.rect.colliderect(player_rect)
-    
-    def is_off_screen(self):
-        """Check if enemy is off screen"""
-        return self.x + self.width < 0
+        """Draw the enemy and return the screen area it covers"""
+        return screen.blit(self.image, (self.x, self.y))
 
 class Collectible:
     """Collectible class - realistic soccer ball with blood"""
+    width = 35
+    height = 35
+    
+    # Ball and panel outlines shared by every collectible, built on first use
+    _base_ball_surface = None
+    
     def __init__(self, x, y, config):
         self.config = config
         
         # Create realistic soccer ball collectible
-        self.width = 35
-        self.height = 35
         self.radius = self.width // 2
         self.center_x = self.width // 2
         self.center_y = self.height // 2
         
-        # Create surface with alpha for transparency
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self._draw_realistic_soccer_ball()
+        # Start from the shared ball and add this one's blood on top
+        if Collectible._base_ball_surface is None:
+            Collectible._build_base_ball(self.width, self.height)
+        self.image = self._base_ball_surface.copy()
+        self._draw_blood_splatters()
         
         self.x = x
         self.y = y
@@ -395,14 +467,17 @@ class Collectible:
         
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
     
-    def _draw_realistic_soccer_ball(self):
-        """Draw a realistic soccer ball with blood splatters"""
-        center = (self.center_x, self.center_y)
-        radius = self.radius
+    @classmethod
+    def _build_base_ball(cls, width, height):
+        """Draw the soccer ball pattern that every collectible shares"""
+        # Create surface with alpha for transparency
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        center = (width // 2, height // 2)
+        radius = width // 2
         
         # Base white circle
-        pygame.draw.circle(self.image, WHITE, center, radius)
-        pygame.draw.circle(self.image, BLACK, center, radius, 2)
+        pygame.draw.circle(surface, WHITE, center, radius)
+        pygame.draw.circle(surface, BLACK, center, radius, 2)
         
         # Draw classic soccer ball pattern (pentagons and hexagons)
         # Central pentagon
@@ -412,7 +487,7 @@ class Collectible:
             px = center[0] + int(radius * 0.4 * math.cos(angle))
             py = center[1] + int(radius * 0.4 * math.sin(angle))
             pentagon_points.append((px, py))
-        pygame.draw.polygon(self.image, BLACK, pentagon_points, 2)
+        pygame.draw.polygon(surface, BLACK, pentagon_points, 2)
         
         # Draw hexagons around the pentagon (simplified pattern)
         for i in range(5):
@@ -427,7 +502,14 @@ class Collectible:
                 hx = hex_center_x + int(radius * 0.25 * math.cos(hex_angle))
                 hy = hex_center_y + int(radius * 0.25 * math.sin(hex_angle))
                 hex_points.append((hx, hy))
-            pygame.draw.polygon(self.image, BLACK, hex_points, 2)
+            pygame.draw.polygon(surface, BLACK, hex_points, 2)
+        
+        cls._base_ball_surface = surface.convert_alpha()
+    
+    def _draw_blood_splatters(self):
+        """Draw this ball's random blood splatters and streaks"""
+        center = (self.center_x, self.center_y)
+        radius = self.radius
         
         # Add blood splatters (dark red)
         blood_color = (150, 0, 0)  # Dark red
@@ -471,10 +553,10 @@ class Collectible:
             if (end_x - center[0])**2 + (end_y - center[1])**2 <= radius**2:
                 pygame.draw.line(self.image, blood_dark, (start_x, start_y), (end_x, end_y), 2)
     
-    def update(self, config):
-        """Update collectible position"""
-        self.speed = config.get_level_config()['wall_speed']
-        self.x -= self.speed
+    def update(self, x, level_config):
+        """Update collectible position - Game.update moves it horizontally"""
+        self.speed = level_config['wall_speed']
+        self.x = x
         
         # Floating animation
         self.float_offset += self.float_speed
@@ -483,19 +565,12 @@ class Collectible:
         elif self.float_offset < -10:
             self.float_speed = 0.1
         
-        self.rect = pygame.Rect(self.x, self.y + self.float_offset, self.width, self.height)
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y + self.float_offset)
     
     def draw(self, screen):
-        """Draw the collectible"""
-        screen.blit(self.image, (self.x, self.y + self.float_offset))
-    
-    def check_collision(self, player_rect):
-        """Check if player collects this item"""
-        return self.rect.colliderect(player_rect) and not self.collected
-    
-    def is_off_screen(self):
-        """Check if collectible is off screen"""
-        return self.x + self.width < 0
+        """Draw the collectible and return the screen area it covers"""
+        return screen.blit(self.image, (self.x, self.y + self.float_offset))
 
 class Game:
     """Main game class"""
@@ -506,22 +581,35 @@ class Game:
         self.screen = pygame.display.set_mode((self.config.screen_width, self.config.screen_height))
         pygame.display.set_caption("Murder Soccer - Apocalyptic Flappy Bird")
         
+        # Only queue the events handle_events uses (mouse motion floods the queue
+        # otherwise). TEXTINPUT stays allowed because it fills in KEYDOWN's unicode,
+        # and WINDOWEXPOSED because an uncovered menu screen has to be redrawn.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.TEXTINPUT,
+                                  pygame.WINDOWEXPOSED])
+        
+        # Read and decode the background and sounds in parallel; SDL releases
+        # the GIL while it loads each file
+        with ThreadPoolExecutor() as pool:
+            bg_future = pool.submit(pygame.image.load, 'assets/images/map.png')
+            sound_futures = [pool.submit(pygame.mixer.Sound, f'assets/sounds/{name}.wav')
+                             for name in ('flap', 'enemy', 'gameover', 'bg')]
+        
         # Load background image and remove white borders
         try:
-            original_bg = pygame.image.load('assets/images/map.png')
+            original_bg = bg_future.result()
         except pygame.error as e:
             print(f"Error loading map image: {e}")
             sys.exit(1)
         self.bg_image = self._crop_white_borders(original_bg)
         self.bg_image = pygame.transform.scale(self.bg_image, 
                                               (self.config.screen_width, self.config.screen_height))
+        self.bg_image = self.bg_image.convert()  # Opaque, so drop the alpha channel for faster blits
         
         # Load sounds
         try:
-            self.flap_sound = pygame.mixer.Sound('assets/sounds/flap.wav')
-            self.enemy_sound = pygame.mixer.Sound('assets/sounds/enemy.wav')
-            self.gameover_sound = pygame.mixer.Sound('assets/sounds/gameover.wav')
-            self.bg_music = pygame.mixer.Sound('assets/sounds/bg.wav')
+            self.flap_sound, self.enemy_sound, self.gameover_sound, self.bg_music = [
+                future.result() for future in sound_futures]
         except pygame.error as e:
             print(f"Warning: Error loading sound files: {e}")
             # Create dummy sounds if loading fails
@@ -547,11 +635,20 @@ class Game:
         self.input_active = True
         self.clock = pygame.time.Clock()
         
+        # Menu screens are only redrawn when something on them may have changed
+        self._menu_dirty = True
+        self._menu_cursor_on = False
+        # Screen areas drawn over in the last playing frame, and whether the
+        # next playing frame must redraw (and update) the whole screen instead
+        self._dirty_rects = []
+        self._full_redraw = True
+        
         # Initialize game objects
         self.player = None
         self.walls = []
         self.enemies = []
         self.collectibles = []
+        self._reset_positions()
         self.last_wall_time = 0
         self.last_enemy_time = 0
         self.last_collectible_time = 0
@@ -561,6 +658,11 @@ class Game:
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 36)
+        
+        # Rendered text surfaces keyed by (text, font, color); see _render_cached
+        self._text_cache = {}
+        # Pre-rendered leaderboard blocks keyed by the highlighted entry; see _leaderboard_surface
+        self._leaderboard_surfaces = {}
     
     def _crop_white_borders(self, image):
         """Remove white borders from top and bottom of image"""
@@ -575,33 +677,37 @@ class Game:
         # Sample pixels instead of checking every pixel for better performance
         sample_step = max(1, width // 20)  # Sample every 20th pixel or at least 1
         
-        # Find top border (first non-white row)
-        top = 0
-        for y in range(height):
-            is_white_row = True
-            for x in range(0, width, sample_step):
-                pixel = surface.get_at((x, y))
-                # Check if pixel is white (or very close to white)
-                if pixel[0] < 250 or pixel[1] < 250 or pixel[2] < 250:
-                    is_white_row = False
+        try:
+            top, bottom = self._non_white_row_bounds(surface, sample_step)
+        except ValueError:
+            # pixels3d only supports 24/32-bit surfaces; check pixel by pixel
+            # Find top border (first non-white row)
+            top = 0
+            for y in range(height):
+                is_white_row = True
+                for x in range(0, width, sample_step):
+                    pixel = surface.get_at((x, y))
+                    # Check if pixel is white (or very close to white)
+                    if pixel[0] < 250 or pixel[1] < 250 or pixel[2] < 250:
+                        is_white_row = False
+                        break
+                if not is_white_row:
+                    top = y
                     break
-            if not is_white_row:
-                top = y
-                break
-        
-        # Find bottom border (last non-white row)
-        bottom = height
-        for y in range(height - 1, -1, -1):
-            is_white_row = True
-            for x in range(0, width, sample_step):
-                pixel = surface.get_at((x, y))
-                # Check if pixel is white (or very close to white)
-                if pixel[0] < 250 or pixel[1] < 250 or pixel[2] < 250:
-                    is_white_row = False
+        
+            # Find bottom border (last non-white row)
+            bottom = height
+            for y in range(height - 1, -1, -1):
+                is_white_row = True
+                for x in range(0, width, sample_step):
+                    pixel = surface.get_at((x, y))
+                    # Check if pixel is white (or very close to white)
+                    if pixel[0] < 250 or pixel[1] < 250 or pixel[2] < 250:
+                        is_white_row = False
+                        break
+                if not is_white_row:
+                    bottom = y + 1
                     break
-            if not is_white_row:
-                bottom = y + 1
-                break
         
         # Crop the image
         if top < bottom and top > 0 or bottom < height:
@@ -610,9 +716,24 @@ class Game:
         else:
             return surface
     
+    @staticmethod
+    def _non_white_row_bounds(surface, sample_step):
+        """Return (top, bottom) of the rows that are not white, checking every
+        sample_step-th pixel of each row with NumPy"""
+        height = surface.get_height()
+        pixels = pygame.surfarray.pixels3d(surface)  # Indexed [x, y, channel]
+        white_rows = (pixels[::sample_step] >= 250).all(axis=2).all(axis=0)
+        del pixels  # Unlock the surface
+        
+        non_white_rows = np.flatnonzero(~white_rows)
+        if len(non_white_rows) == 0:
+            return 0, height
+        return int(non_white_rows[0]), int(non_white_rows[-1]) + 1
+    
     def reset_game(self):
         """Reset game to initial state"""
         self.state = "playing"
+        self._full_redraw = True
         self.score = 0
         self.collectibles_collected = 0
         
@@ -624,6 +745,7 @@ class Game:
         self.walls = []
         self.enemies = []
         self.collectibles = []
+        self._reset_positions()
         self.last_wall_time = pygame.time.get_ticks()
         self.last_enemy_time = pygame.time.get_ticks()
         self.last_collectible_time = pygame.time.get_ticks()
@@ -632,6 +754,29 @@ class Game:
         if self.bg_music:
             self.bg_music.play(-1)  # Loop forever
     
+    def _reset_positions(self):
+        """Clear the x positions kept alongside self.walls, self.enemies and
+        self.collectibles, so each class can be moved with one array operation,
+        and the per-wall arrays used to test walls against the player"""
+        self._wall_x = np.empty(0)
+        # Rows of (top y, top height, bottom y, bottom height), fixed per wall
+        self._wall_spans = np.empty((0, 4))
+        self._wall_passed = np.empty(0, dtype=bool)
+        self._enemy_x = np.empty(0)
+        self._collectible_x = np.empty(0)
+    
+    @staticmethod
+    def _swap_remove(entities, xs, remove):
+        """Remove the entities flagged in remove, and their x positions, by moving
+        the last entry into each freed slot (order is not kept). Returns xs."""
+        # Go from the back so the entry moved into a slot is never itself flagged
+        for i in np.flatnonzero(remove)[::-1].tolist():
+            entities[i] = entities[-1]
+            entities.pop()
+            xs[i] = xs[-1]
+            xs = xs[:-1]
+        return xs
+    
     def spawn_wall(self):
         """Spawn a new wall"""
         level_config = self.config.get_level_config()
@@ -641,14 +786,18 @@ class Game:
             # First wall starts further away
             x = self.config.screen_width + 200
         else:
-            # Subsequent walls spaced properly - find the rightmost wall
-            if self.walls:
-                last_wall_x = max([wall.x for wall in self.walls])
-                x = last_wall_x + spacing
-            else:
-                x = self.config.screen_width + 200
-        
-        self.walls.append(Wall(x, self.config))
+            # Subsequent walls spaced properly - walls are appended in order,
+            # so the last one is the rightmost
+            x = self.walls[-1].x + spacing
+        
+        wall = Wall(x, self.config)
+        self.walls.append(wall)
+        self._wall_x = np.append(self._wall_x, x)
+        # update() drops off-screen walls as a prefix, which relies on this order
+        assert len(self.walls) < 2 or self._wall_x[-2] <= self._wall_x[-1], "walls must stay sorted by x"
+        self._wall_spans = np.append(self._wall_spans, [[wall.top_rect.y, wall.top_rect.height,
+                                                         wall.bottom_rect.y, wall.bottom_rect.height]], axis=0)
+        self._wall_passed = np.append(self._wall_passed, False)
     
     def spawn_enemy(self):
         """Spawn a new enemy"""
@@ -660,6 +809,7 @@ class Game:
         y = random.randint(50, self.config.screen_height - 50)
         
         self.enemies.append(Enemy(x, y, self.config))
+        self._enemy_x = np.append(self._enemy_x, x)
     
     def spawn_collectible(self):
         """Spawn a new collectible"""
@@ -668,10 +818,16 @@ class Game:
         y = random.randint(100, self.config.screen_height - 100)
         
         self.collectibles.append(Collectible(x, y, self.config))
+        self._collectible_x = np.append(self._collectible_x, x)
     
     def handle_events(self):
         """Handle pygame events"""
         for event in pygame.event.get():
+            # Any event may change (or uncover) the menu screen
+            self._menu_dirty = True
+            if event.type == pygame.WINDOWEXPOSED:
+                self._full_redraw = True
+            
             if event.type == pygame.QUIT:
                 return False
             
@@ -728,17 +884,18 @@ class Game:
             return
         
         current_time = pygame.time.get_ticks()
+        # Looked up once per frame and passed to every entity's update()
         level_config = self.config.get_level_config()
         
         # Update player
-        self.player.update(self.config)
+        self.player.update(level_config, self.config)
         
         # Spawn walls based on distance
         # Check if we need a new wall (when rightmost wall is close enough)
         if len(self.walls) == 0:
             self.spawn_wall()
         else:
-            rightmost_wall_x = max([wall.x for wall in self.walls])
+            rightmost_wall_x = self.walls[-1].x
             # Spawn new wall when rightmost wall is past a certain point
             if rightmost_wall_x < self.config.screen_width - level_config['wall_spacing']:
                 self.spawn_wall()
@@ -753,56 +910,74 @@ class Game:
             self.spawn_collectible()
             self.last_collectible_time = current_time
         
-        # Update walls
-        for wall in self.walls[:]:
-            wall.update(self.config)
-            
-            # Check collision
-            if wall.check_collision(self.player.rect):
-                self.game_over()
-                return
-            
-            # Check if passed
-            if not wall.passed and wall.x + wall.width < self.player.x:
-                wall.passed = True
-                self.score += 1
-            
-            # Remove off-screen walls
-            if wall.is_off_screen():
-                self.walls.remove(wall)
+        # Update walls, advancing every wall's x position in one operation
+        self._wall_x -= level_config['wall_speed']
+        for wall, x in zip(self.walls, self._wall_x.tolist()):
+            wall.update(x)
+        
+        # Check collision against both halves of every wall with array operations.
+        # Wall rects take whole-pixel x positions, rounded half away from zero
+        # like pygame rounds float coordinates.
+        px, py, pw, ph = self.player.rect
+        wall_left = np.trunc(self._wall_x + np.copysign(0.5, self._wall_x))
+        spans = self._wall_spans
+        in_column = (wall_left < px + pw) & (wall_left + Wall.width > px)
+        hits_top = (spans[:, 1] > 0) & (spans[:, 0] < py + ph) & (spans[:, 0] + spans[:, 1] > py)
+        hits_bottom = (spans[:, 3] > 0) & (spans[:, 2] < py + ph) & (spans[:, 2] + spans[:, 3] > py)
+        if (in_column & (hits_top | hits_bottom)).any():
+            self.game_over()
+            return
         
-        # Update enemies
-        for enemy in self.enemies[:]:
-            enemy.update(self.player.x, self.player.y, self.config)
-            
-            # Check collision
-            if enemy.check_collision(self.player.rect):
-                if self.enemy_sound:
-                    self.enemy_sound.play()
-                self.game_over()
-                return
-            
-            # Remove off-screen enemies
-            if enemy.is_off_screen():
-                self.enemies.remove(enemy)
+        # Score each wall once, when it is fully behind the player
+        passed = ~self._wall_passed & (self._wall_x + Wall.width < self.player.x)
+        self.score += int(passed.sum())
+        self._wall_passed |= passed
+        
+        # Remove off-screen walls
+        # Walls stay sorted by x, so the off-screen ones are always at the front
+        if self.walls and self._wall_x[0] + Wall.width < 0:
+            off_screen = int(np.searchsorted(self._wall_x, -Wall.width))
+            del self.walls[:off_screen]
+            self._wall_x = self._wall_x[off_screen:]
+            self._wall_spans = self._wall_spans[off_screen:]
+            self._wall_passed = self._wall_passed[off_screen:]
+        
+        # Update enemies; they move toward the player horizontally until they reach it
+        self._enemy_x[self._enemy_x > self.player.x] -= level_config['enemy_speed']
+        for enemy, x in zip(self.enemies, self._enemy_x.tolist()):
+            enemy.update(x, level_config, self.config)
+        
+        # Check collision
+        if self.player.rect.collideobjects(self.enemies, key=_get_rect) is not None:
+            if self.enemy_sound:
+                self.enemy_sound.play()
+            self.game_over()
+            return
+        
+        # Remove off-screen enemies
+        self._enemy_x = self._swap_remove(self.enemies, self._enemy_x, self._enemy_x + Enemy.width < 0)
         
         # Update collectibles
-        for collectible in self.collectibles[:]:
-            collectible.update(self.config)
-            
+        self._collectible_x -= level_config['wall_speed']
+        for collectible, x in zip(self.collectibles, self._collectible_x.tolist()):
+            collectible.update(x, level_config)
+        
+        hits = self.player.rect.collideobjectsall(self.collectibles, key=_get_rect)
+        for collectible in hits:
             # Check collision
-            if collectible.check_collision(self.player.rect):
+            if not collectible.collected:
                 collectible.collected = True
                 self.score += collectible.value
                 self.collectibles_collected += 1
                 if self.flap_sound:  # Reuse flap sound for collection
                     self.flap_sound.play()
-                self.collectibles.remove(collectible)
-                continue
-            
-            # Remove off-screen collectibles
-            if collectible.is_off_screen():
-                self.collectibles.remove(collectible)
+        
+        # Remove collected and off-screen collectibles
+        remove = self._collectible_x + Collectible.width < 0
+        if hits:
+            remove |= np.fromiter(map(_get_collected, self.collectibles), dtype=bool,
+                                  count=len(self.collectibles))
+        self._collectible_x = self._swap_remove(self.collectibles, self._collectible_x, remove)
         
         # Check boundaries
         if self.player.y + self.player.height >= self.config.screen_height or self.player.y <= 0:
@@ -811,6 +986,7 @@ class Game:
     def game_over(self):
         """Handle game over"""
         self.state = "gameover"
+        self._menu_dirty = True
         if self.bg_music:
             self.bg_music.stop()
         if self.gameover_sound:
@@ -818,15 +994,51 @@ class Game:
         
         # Save score with player name
         is_new_high = self.high_score.add_score(self.player_name, self.score)
+        self._leaderboard_surfaces.clear()
         if is_new_high:
             print(f"New high score: {self.score} by {self.player_name}!")
     
+    def _render_cached(self, font, text, color):
+        """Return font.render(text, True, color), rendering each distinct text only once"""
+        key = (text, font, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Scores and typed names keep producing new strings, so keep the cache bounded
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
+    
+    def _leaderboard_surface(self, highlight=None):
+        """Return the leaderboard title and top 5 entries drawn onto one surface,
+        or None if there are no scores. highlight is a (name, score) entry to
+        draw in green. The title is centered 30px below the surface's top and
+        the surface is meant to be blitted centered horizontally."""
+        if highlight not in self._leaderboard_surfaces:
+            leaderboard = self.high_score.get_top_scores(5)
+            surface = None
+            if leaderboard:
+                width = 500
+                surface = pygame.Surface((width, 70 + 30 * len(leaderboard)), pygame.SRCALPHA).convert_alpha()
+                title = self.font_medium.render("LEADERBOARD", True, ORANGE)
+                surface.blit(title, title.get_rect(center=(width//2, 30)))
+                
+                y_offset = 70
+                for i, entry in enumerate(leaderboard):
+                    rank_text = f"{i+1}. {entry['name'][:12]:12s} - {entry['score']}"
+                    color = GREEN if (entry['name'], entry['score']) == highlight else WHITE
+                    entry_text = self.font_small.render(rank_text, True, color)
+                    surface.blit(entry_text, entry_text.get_rect(center=(width//2, y_offset)))
+                    y_offset += 30
+            self._leaderboard_surfaces[highlight] = surface
+        return self._leaderboard_surfaces[highlight]
+    
     def draw_signin_screen(self):
         """Draw the sign-in screen"""
         self.screen.blit(self.bg_image, (0, 0))
         
         # Title
-        title_text = self.font_large.render("ENTER YOUR NAME", True, RED)
+        title_text = self._render_cached(self.font_large, "ENTER YOUR NAME", RED)
         title_rect = title_text.get_rect(center=(self.config.screen_width//2, self.config.screen_height//2 - 150))
         self.screen.blit(title_text, title_rect)
         
@@ -842,18 +1054,18 @@ class Game:
             if int(pygame.time.get_ticks() / 500) % 2:
                 display_name += "_"
         
-        name_text = self.font_medium.render(display_name if display_name else "Enter name...", True, BLACK)
+        name_text = self._render_cached(self.font_medium, display_name if display_name else "Enter name...", BLACK)
         name_rect = name_text.get_rect(center=input_box.center)
         self.screen.blit(name_text, name_rect)
         
         # Instructions
-        inst_text = self.font_small.render("Press ENTER to continue", True, WHITE)
+        inst_text = self._render_cached(self.font_small, "Press ENTER to continue", WHITE)
         inst_rect = inst_text.get_rect(center=(self.config.screen_width//2, self.config.screen_height//2 + 50))
         self.screen.blit(inst_text, inst_rect)
         
         # Show current player name
         if self.player_name:
-            player_text = self.font_small.render(f"Playing as: {self.player_name}", True, GREEN)
+            player_text = self._render_cached(self.font_small, f"Playing as: {self.player_name}", GREEN)
             player_rect = player_text.get_rect(center=(self.config.screen_width//2, self.config.screen_height//2 + 100))
             self.screen.blit(player_text, player_rect)
     
@@ -862,47 +1074,37 @@ class Game:
         self.screen.blit(self.bg_image, (0, 0))
         
         # Title
-        title_text = self.font_large.render("MURDER SOCCER", True, RED)
+        title_text = self._render_cached(self.font_large, "MURDER SOCCER", RED)
         title_rect = title_text.get_rect(center=(self.config.screen_width//2, 80))
         self.screen.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = self.font_medium.render("Apocalyptic Flappy Bird", True, WHITE)
+        subtitle_text = self._render_cached(self.font_medium, "Apocalyptic Flappy Bird", WHITE)
         subtitle_rect = subtitle_text.get_rect(center=(self.config.screen_width//2, 130))
         self.screen.blit(subtitle_text, subtitle_rect)
         
         # Player name display
         if self.player_name:
-            player_text = self.font_small.render(f"Player: {self.player_name}", True, GREEN)
+            player_text = self._render_cached(self.font_small, f"Player: {self.player_name}", GREEN)
             player_rect = player_text.get_rect(center=(self.config.screen_width//2, 170))
             self.screen.blit(player_text, player_rect)
         
         # Leaderboard
-        leaderboard = self.high_score.get_top_scores(5)
+        leaderboard = self._leaderboard_surface()
         if leaderboard:
-            leaderboard_title = self.font_medium.render("LEADERBOARD", True, ORANGE)
-            leaderboard_title_rect = leaderboard_title.get_rect(center=(self.config.screen_width//2, 220))
-            self.screen.blit(leaderboard_title, leaderboard_title_rect)
-            
-            y_offset = 260
-            for i, entry in enumerate(leaderboard):
-                rank_text = f"{i+1}. {entry['name'][:12]:12s} - {entry['score']}"
-                entry_text = self.font_small.render(rank_text, True, WHITE)
-                entry_rect = entry_text.get_rect(center=(self.config.screen_width//2, y_offset))
-                self.screen.blit(entry_text, entry_rect)
-                y_offset += 30
+            self.screen.blit(leaderboard, leaderboard.get_rect(midtop=(self.config.screen_width//2, 190)))
         
         # Start button
         button_rect = pygame.Rect(self.config.screen_width//2 - 100, self.config.screen_height - 150, 200, 60)
         pygame.draw.rect(self.screen, GREEN, button_rect)
         pygame.draw.rect(self.screen, WHITE, button_rect, 3)
         
-        start_text = self.font_medium.render("START", True, BLACK)
+        start_text = self._render_cached(self.font_medium, "START", BLACK)
         start_rect = start_text.get_rect(center=button_rect.center)
         self.screen.blit(start_text, start_rect)
         
         # Instructions
-        inst_text = self.font_small.render("Press SPACE or Click to Flap", True, WHITE)
+        inst_text = self._render_cached(self.font_small, "Press SPACE or Click to Flap", WHITE)
         inst_rect = inst_text.get_rect(center=(self.config.screen_width//2, self.config.screen_height - 70))
         self.screen.blit(inst_text, inst_rect)
     
@@ -911,44 +1113,41 @@ class Game:
         self.screen.blit(self.bg_image, (0, 0))
         
         # Game Over text
-        gameover_text = self.font_large.render("GAME OVER", True, RED)
+        gameover_text = self._render_cached(self.font_large, "GAME OVER", RED)
         gameover_rect = gameover_text.get_rect(center=(self.config.screen_width//2, 80))
         self.screen.blit(gameover_text, gameover_rect)
         
         # Score
-        score_text = self.font_medium.render(f"Score: {self.score}", True, WHITE)
+        score_text = self._render_cached(self.font_medium, f"Score: {self.score}", WHITE)
         score_rect = score_text.get_rect(center=(self.config.screen_width//2, 140))
         self.screen.blit(score_text, score_rect)
         
         # Collectibles collected
-        collect_text = self.font_small.render(f"Collectibles: {self.collectibles_collected}", True, GREEN)
+        collect_text = self._render_cached(self.font_small, f"Collectibles: {self.collectibles_collected}", GREEN)
         collect_rect = collect_text.get_rect(center=(self.config.screen_width//2, 180))
         self.screen.blit(collect_text, collect_rect)
         
-        # Leaderboard
-        leaderboard = self.high_score.get_top_scores(5)
+        # Leaderboard, highlighting the current player's score if in top 5
+        leaderboard = self._leaderboard_surface((self.player_name, self.score))
         if leaderboard:
-            leaderboard_title = self.font_medium.render("LEADERBOARD", True, ORANGE)
-            leaderboard_title_rect = leaderboard_title.get_rect(center=(self.config.screen_width//2, 240))
-            self.screen.blit(leaderboard_title, leaderboard_title_rect)
-            
-            y_offset = 280
-            for i, entry in enumerate(leaderboard):
-                rank_text = f"{i+1}. {entry['name'][:12]:12s} - {entry['score']}"
-                # Highlight current player's score if in top 5
-                color = GREEN if entry['name'] == self.player_name and entry['score'] == self.score else WHITE
-                entry_text = self.font_small.render(rank_text, True, color)
-                entry_rect = entry_text.get_rect(center=(self.config.screen_width//2, y_offset))
-                self.screen.blit(entry_text, entry_rect)
-                y_offset += 30
+            self.screen.blit(leaderboard, leaderboard.get_rect(midtop=(self.config.screen_width//2, 210)))
         
         # Restart instruction
-        restart_text = self.font_small.render("Press SPACE to return to menu", True, WHITE)
+        restart_text = self._render_cached(self.font_small, "Press SPACE to return to menu", WHITE)
         restart_rect = restart_text.get_rect(center=(self.config.screen_width//2, self.config.screen_height - 50))
         self.screen.blit(restart_text, restart_rect)
     
     def draw(self):
         """Draw everything"""
+        if self.state in ("signin", "start", "gameover"):
+            # Menus are static apart from the sign-in cursor blinking every 500ms,
+            # so leave the last frame on screen until one of them changes
+            cursor_on = bool(pygame.time.get_ticks() // 500 % 2)
+            if not self._menu_dirty and cursor_on == self._menu_cursor_on:
+                return
+            self._menu_dirty = False
+            self._menu_cursor_on = cursor_on
+        
         if self.state == "signin":
             self.draw_signin_screen()
         elif self.state == "start":
@@ -956,47 +1155,69 @@ class Game:
         elif self.state == "gameover":
             self.draw_gameover_screen()
         elif self.state == "playing":
-            # Draw background
-            self.screen.blit(self.bg_image, (0, 0))
+            # Draw background: in full on the first frame, otherwise only over
+            # the areas drawn on last frame (everything is drawn again below)
+            if self._full_redraw:
+                self.screen.blit(self.bg_image, (0, 0))
+            else:
+                for rect in self._dirty_rects:
+                    self.screen.blit(self.bg_image, rect, rect)
+            dirty_rects = []
             
             # Draw walls
             for wall in self.walls:
-                wall.draw(self.screen)
+                dirty_rects.extend(wall.draw(self.screen))
             
             # Draw collectibles
             for collectible in self.collectibles:
-                collectible.draw(self.screen)
+                dirty_rects.append(collectible.draw(self.screen))
             
             # Draw enemies
             for enemy in self.enemies:
-                enemy.draw(self.screen)
+                dirty_rects.append(enemy.draw(self.screen))
             
             # Draw player
-            self.player.draw(self.screen)
+            dirty_rects.append(self.player.draw(self.screen))
             
             # Draw score
-            score_text = self.font_medium.render(f"Score: {self.score}", True, WHITE)
-            self.screen.blit(score_text, (20, 20))
+            score_text = self._render_cached(self.font_medium, f"Score: {self.score}", WHITE)
+            dirty_rects.append(self.screen.blit(score_text, (20, 20)))
             
             # Draw collectibles count
-            collect_text = self.font_small.render(f"Collectibles: {self.collectibles_collected}", True, GREEN)
-            self.screen.blit(collect_text, (20, 60))
+            collect_text = self._render_cached(self.font_small, f"Collectibles: {self.collectibles_collected}", GREEN)
+            dirty_rects.append(self.screen.blit(collect_text, (20, 60)))
             
             # Draw high score
-            hs_text = self.font_small.render(f"High Score: {self.high_score.high_score}", True, ORANGE)
-            self.screen.blit(hs_text, (20, 90))
+            hs_text = self._render_cached(self.font_small, f"High Score: {self.high_score.high_score}", ORANGE)
+            dirty_rects.append(self.screen.blit(hs_text, (20, 90)))
+            
+            # Send only the areas that changed (where things were, and are now) to the display
+            if self._full_redraw:
+                pygame.display.flip()
+                self._full_redraw = False
+            else:
+                pygame.display.update(self._dirty_rects + dirty_rects)
+            self._dirty_rects = dirty_rects
+            return
         
         pygame.display.flip()
     
     def run(self):
         """Main game loop"""
         running = True
+        accumulated_ms = 0.0
         
         while running:
             running = self.handle_events()
-            self.update()
+            
+            # Run as many fixed-size updates as the time since the last frame
+            # covers, so game speed doesn't depend on the frame rate
+            accumulated_ms = min(accumulated_ms + self.clock.tick(60), MAX_CATCH_UP_MS)  # 60 FPS cap
+            while accumulated_ms >= UPDATE_STEP_MS:
+                self.update()
+                accumulated_ms -= UPDATE_STEP_MS
+            
             self.draw()
-            self.clock.tick(60)  # 60 FPS
         
         pygame.quit()
 
@@ -1,27 +1,58 @@
 import pandas as pd
-import glob
 import os
+import sys
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as ds
+except ImportError:  # pyarrow is optional; fall back to reading each file with pandas
+    pa = None
 
 # Find all CSV files starting with 'amzn' (case-insensitive)
-csv_files = glob.glob('AMZN*.csv') + glob.glob('amzn*.csv')
+# with a single directory scan
+csv_files = sorted(name for name in os.listdir('.')
+                   if name.lower().startswith('amzn') and name.lower().endswith('.csv'))
 
-# Remove duplicates and sort
-csv_files = sorted(list(set(csv_files)))
+if not csv_files:
+    print("No AMZN CSVs found")
+    sys.exit(1)
 
 print(f"Found {len(csv_files)} CSV files:")
 for file in csv_files:
     print(f"  - {file}")
 
-# Read and combine all CSV files
-dataframes = []
-for file in csv_files:
-    print(f"\nReading {file}...")
-    df = pd.read_csv(file)
-    print(f"  Rows: {len(df)}")
-    dataframes.append(df)
-
-# Combine all dataframes
-combined_df = pd.concat(dataframes, ignore_index=True)
+if pa is not None:
+    # Read all CSV files as one pyarrow dataset. Every column is read as text,
+    # since some exports have a ticker row under the header that makes their
+    # columns non-numeric; an empty cell becomes a missing value as in pd.read_csv.
+    columns = pd.read_csv(csv_files[0], nrows=0).columns
+    dataset = ds.dataset(
+        csv_files,
+        schema=pa.schema([(column, pa.string()) for column in columns]),
+        format=ds.CsvFileFormat(convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)),
+    )
+    
+    tables = []
+    for fragment in dataset.get_fragments():
+        print(f"\nReading {fragment.path}...")
+        table = fragment.to_table(schema=dataset.schema)
+        print(f"  Rows: {table.num_rows}")
+        tables.append(table)
+    
+    # Combine all tables (without copying) and convert to pandas once
+    combined_df = pa.concat_tables(tables).to_pandas()
+else:
+    # Read and combine all CSV files
+    dataframes = []
+    for file in csv_files:
+        print(f"\nReading {file}...")
+        df = pd.read_csv(file)
+        print(f"  Rows: {len(df)}")
+        dataframes.append(df)
+    
+    # Combine all dataframes
+    combined_df = pd.concat(dataframes, ignore_index=True)
 
 # Remove duplicates based on 'date' column if they exist
 initial_rows = len(combined_df)
@@ -32,7 +63,12 @@ if initial_rows != final_rows:
     print(f"\nRemoved {initial_rows - final_rows} duplicate rows based on date")
 
 # Sort by date (handle different date formats and timezones)
-combined_df['date'] = pd.to_datetime(combined_df['date'], format='mixed', errors='coerce', utc=True)
+# Every export uses ISO 8601 dates, which pandas parses with its C fast path;
+# fall back to per-value format inference if a file ever uses another format
+try:
+    combined_df['date'] = pd.to_datetime(combined_df['date'], format='ISO8601', utc=True)
+except ValueError:
+    combined_df['date'] = pd.to_datetime(combined_df['date'], format='mixed', errors='coerce', utc=True)
 # Convert all to timezone-naive datetime for consistent sorting
 if combined_df['date'].dt.tz is not None:
     combined_df['date'] = combined_df['date'].dt.tz_convert(None)
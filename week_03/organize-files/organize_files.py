@@ -4,22 +4,23 @@ File Organizer Script
 Organizes files in a directory into subfolders: images, videos, audios, documents
 """
 
+import errno
 import os
 import shutil
 from pathlib import Path
 
 
-def get_file_category(file_path):
+def get_file_category(file_name):
     """
     Determine the category of a file based on its extension.
     
     Args:
-        file_path: Path to the file
+        file_name: Name of the file
         
     Returns:
         Category name: 'images', 'videos', 'audios', 'documents', or None
     """
-    extension = file_path.suffix.lower()
+    extension = os.path.splitext(file_name)[1].lower()
     
     # Image extensions
     image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', 
@@ -51,6 +52,34 @@ def get_file_category(file_path):
         return None
 
 
+def move_file(source, destination):
+    """
+    Move a file without ever replacing an existing one.
+    
+    The file is hard-linked under its new name, which fails if that name is
+    already taken (in any case, on case-insensitive filesystems), and then
+    unlinked from the old one. Across filesystems, or where hard links
+    aren't supported, it checks the destination and falls back to shutil.move.
+    
+    Args:
+        source: Path of the file to move
+        destination: Path to move it to
+        
+    Raises:
+        FileExistsError: If something already exists at destination
+    """
+    try:
+        os.link(source, destination)
+    except FileExistsError:
+        raise
+    except OSError:
+        if os.path.lexists(destination):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), destination)
+        shutil.move(source, destination)
+    else:
+        os.unlink(source)
+
+
 def organize_files(source_dir):
     """
     Organize files in the source directory into subfolders.
@@ -68,48 +97,58 @@ def organize_files(source_dir):
         print(f"Error: '{source_dir}' is not a directory.")
         return
     
-    # Create subfolders
+    # Create subfolders, noting the names already taken in each
     categories = ['images', 'videos', 'audios', 'documents']
+    taken_names = {}
     for category in categories:
         category_path = source_path / category
         category_path.mkdir(exist_ok=True)
+        taken_names[category] = set(os.listdir(category_path))
         print(f"Created/verified folder: {category}")
     
     # Count files moved
     moved_counts = {category: 0 for category in categories}
     skipped_files = []
     
-    # Process all files in the source directory
-    for file_path in source_path.iterdir():
+    # Process all files in the source directory (scandir caches each
+    # entry's type, so only the moves themselves touch the filesystem)
+    with os.scandir(source_path) as it:
+        entries = list(it)
+    
+    for entry in entries:
         # Skip directories and hidden files
-        if file_path.is_dir() or file_path.name.startswith('.'):
+        if entry.is_dir() or entry.name.startswith('.'):
             continue
         
-        category = get_file_category(file_path)
+        category = get_file_category(entry.name)
         
         if category:
-            destination = source_path / category / file_path.name
-            
-            # Handle duplicate filenames
-            if destination.exists():
-                base_name = file_path.stem
-                extension = file_path.suffix
-                counter = 1
-                while destination.exists():
-                    new_name = f"{base_name}_{counter}{extension}"
-                    destination = source_path / category / new_name
-                    counter += 1
+            base_name, extension = os.path.splitext(entry.name)
+            new_name = entry.name
+            counter = 1
             
             try:
-                shutil.move(str(file_path), str(destination))
+                while True:
+                    # Handle duplicate filenames
+                    while new_name in taken_names[category]:
+                        new_name = f"{base_name}_{counter}{extension}"
+                        counter += 1
+                    try:
+                        move_file(entry.path, os.path.join(source_path, category, new_name))
+                        break
+                    except FileExistsError:
+                        # Taken in a way the listing didn't show, e.g. under
+                        # another case on a case-insensitive filesystem
+                        taken_names[category].add(new_name)
+                taken_names[category].add(new_name)
                 moved_counts[category] += 1
-                print(f"Moved: {file_path.name} -> {category}/")
+                print(f"Moved: {entry.name} -> {category}/")
             except Exception as e:
-                print(f"Error moving {file_path.name}: {e}")
-                skipped_files.append(file_path.name)
+                print(f"Error moving {entry.name}: {e}")
+                skipped_files.append(entry.name)
         else:
-            skipped_files.append(file_path.name)
-            print(f"Skipped (unknown type): {file_path.name}")
+            skipped_files.append(entry.name)
+            print(f"Skipped (unknown type): {entry.name}")
     
     # Print summary
     print("\n" + "="*50)
@@ -3,6 +3,8 @@
 Scrape country data from scrapethissite.com and create visualization.
 """
 
+import heapq
+import html
 import ssl
 import urllib.request
 import urllib.error
@@ -18,6 +20,19 @@ try:
 except ImportError:
     USE_CERTIFI = False
 
+# Patterns for parse_countries_with_regex, compiled once at import
+# Each country block: <div class="col-md-4 country"> ... </div><!--.col-->
+COUNTRY_RE = re.compile(r'<div class="col-md-4 country">(.*?)</div>\s*<!--\.col-->', re.DOTALL)
+# All four fields of a block, in page order, in one pass. The name comes
+# after the <i> flag icon tag in <h3 class="country-name">.
+COUNTRY_FIELDS_RE = re.compile(
+    r'<h3 class="country-name">.*?<i[^>]*></i>\s*(?P<name>[^<]+)</h3>'
+    r'.*?<span class="country-capital">(?P<capital>[^<]+)</span>'
+    r'.*?<span class="country-population">(?P<population>[^<]+)</span>'
+    r'.*?<span class="country-area">(?P<area>[^<]+)</span>',
+    re.DOTALL,
+)
+
 
 def parse_countries_with_regex(html_content: str) -> List[Dict]:
     """
@@ -26,48 +41,23 @@ def parse_countries_with_regex(html_content: str) -> List[Dict]:
     """
     countries = []
     
-    # Pattern to match each country div block
-    # Matches: <div class="col-md-4 country"> ... </div>
-    country_pattern = r'<div class="col-md-4 country">(.*?)</div>\s*<!--\.col-->'
-    
-    # Find all country blocks
-    country_blocks = re.findall(country_pattern, html_content, re.DOTALL)
-    
-    for block in country_blocks:
-        country = {}
-        
-        # Extract country name from <h3 class="country-name">...</h3>
-        # The name comes after the <i> flag icon tag
-        name_match = re.search(r'<h3 class="country-name">.*?<i[^>]*></i>\s*([^<]+)</h3>', block, re.DOTALL)
-        if name_match:
-            country['name'] = name_match.group(1).strip()
-        
-        # Extract capital from <span class="country-capital">...</span>
-        capital_match = re.search(r'<span class="country-capital">([^<]+)</span>', block)
-        if capital_match:
-            country['capital'] = capital_match.group(1).strip()
-        
-        # Extract population from <span class="country-population">...</span>
-        pop_match = re.search(r'<span class="country-population">([^<]+)</span>', block)
-        if pop_match:
-            try:
-                pop_str = pop_match.group(1).strip().replace(',', '')
-                country['population'] = int(pop_str)
-            except ValueError:
-                continue
-        
-        # Extract area from <span class="country-area">...</span>
-        area_match = re.search(r'<span class="country-area">([^<]+)</span>', block)
-        if area_match:
-            try:
-                area_str = area_match.group(1).strip().replace(',', '')
-                country['area_km2'] = float(area_str)
-            except ValueError:
-                continue
-        
-        # Only add if all fields are present
-        if all(key in country for key in ['name', 'capital', 'population', 'area_km2']):
-            countries.append(country)
+    # Walk the country blocks as they are found
+    for block_match in COUNTRY_RE.finditer(html_content):
+        # Only blocks with all fields present are kept
+        fields = COUNTRY_FIELDS_RE.search(block_match.group(1))
+        if not fields:
+            continue
+        
+        try:
+            countries.append({
+                # Text fields may contain entities, e.g. "St. John&#39;s"
+                'name': html.unescape(fields['name'].strip()),
+                'capital': html.unescape(fields['capital'].strip()),
+                'population': int(fields['population'].strip().replace(',', '')),
+                'area_km2': float(fields['area'].strip().replace(',', '')),
+            })
+        except ValueError:
+            continue
     
     return countries
 
@@ -134,11 +124,12 @@ def write_csv(countries: List[Dict], filename: str) -> int:
     
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
         fieldnames = ['name', 'capital', 'population', 'area_km2']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.writer(csvfile)
         
-        writer.writeheader()
-        for country in countries:
-            writer.writerow(country)
+        writer.writerow(fieldnames)
+        writer.writerows((country['name'], country['capital'],
+                          country['population'], country['area_km2'])
+                         for country in countries)
     
     return len(countries)
 
@@ -151,23 +142,18 @@ def create_visualization(csv_filename: str, output_image: str):
         csv_filename: Input CSV file
         output_image: Output image filename
     """
-    # Read CSV
-    countries = []
+    # Read CSV, keeping only the 10 most populous (name, population) rows
     with open(csv_filename, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            countries.append({
-                'name': row['name'],
-                'population': int(row['population'])
-            })
-    
-    # Sort by population and get top 10
-    countries.sort(key=lambda x: x['population'], reverse=True)
-    top10 = countries[:10]
+        reader = csv.reader(csvfile)
+        header = next(reader)
+        name_col = header.index('name')
+        population_col = header.index('population')
+        top10 = heapq.nlargest(10, ((row[name_col], int(row[population_col])) for row in reader),
+                               key=lambda x: x[1])
     
     # Create bar chart
-    names = [c['name'] for c in top10]
-    populations = [c['population'] for c in top10]
+    names = [name for name, _ in top10]
+    populations = [population for _, population in top10]
     
     plt.figure(figsize=(12, 6))
     plt.barh(names, populations, color='steelblue')
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import re
 import sys
 import warnings
 
@@ -8,6 +9,9 @@ from newsletter_crew.crew import NewsletterCrew
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+# Full HTML document embedded in a task's output
+_HTML_RE = re.compile(r'(<!DOCTYPE.*?</html>)', re.DOTALL)
+
 # This main file is intended to be a way for you to run your
 # crew locally, so refrain from adding unnecessary logic into this file.
 # Replace with inputs you want to test with, it will automatically
@@ -28,12 +32,12 @@ def run():
         if result and hasattr(result, 'tasks_output'):
             # Try to get the HTML from the last task (reporting_task)
             for task_output in result.tasks_output:
-                if 'reporting' in str(task_output).lower() or 'html' in str(task_output).lower():
-                    output_str = str(task_output)
+                output_str = str(task_output)
+                output_lower = output_str.lower()
+                if 'reporting' in output_lower or 'html' in output_lower:
                     # Try to extract HTML if it exists in the output
                     if '<!DOCTYPE' in output_str or '<html' in output_str:
-                        import re
-                        html_match = re.search(r'(<!DOCTYPE.*?</html>)', output_str, re.DOTALL)
+                        html_match = _HTML_RE.search(output_str)
                         if html_match:
                             with open('report.html', 'w', encoding='utf-8') as f:
                                 f.write(html_match.group(1))